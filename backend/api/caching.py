@@ -0,0 +1,191 @@
+"""
+Caching for Read-Mostly Endpoints
+
+Indicators, hot topics, calendar and the dashboard only change when the
+pipeline (or a ranking refresh) writes new data. Two layers:
+- http_cache: weak ETag derived from the current data version plus a
+  short Cache-Control max-age, answering 304 when the client has it
+  (http_revalidate: same ETag, no max-age, for data the UI writes)
+- ttl_cache: in-process payload cache so repeat requests skip SQLite
+
+Usage:
+    @router.get("/topics/hot", dependencies=[Depends(http_cache)])
+    @ttl_cache(seconds=30)
+    async def get_hot_topics():
+        async with get_pool().acquire() as db:
+            ...
+"""
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request, Response
+
+from database import get_pool
+
+
+# Seconds browsers/proxies may reuse a response without revalidating
+CACHE_MAX_AGE = 60
+
+# Seconds the data version is reused before asking the database again
+VERSION_TTL = 5
+
+# (expires_at, version) - refreshed at most every VERSION_TTL seconds
+_version_cache: tuple[float, str] | None = None
+
+# Max number of cached payloads kept by ttl_cache (least recently used evicted)
+TTL_CACHE_MAX_ENTRIES = 256
+
+# Bumped by invalidate_cache() after this process writes data
+CACHE_EPOCH = 0
+
+# key -> (expires_at, payload)
+_payloads: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+# key -> task computing the payload, shared by concurrent misses
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+async def get_data_version() -> str:
+    """
+    Get a string that changes whenever pipeline output changes.
+
+    The pipeline runs in the scheduler process, so it cannot notify the
+    API directly. Instead the version is read from the database: the
+    latest run_history entry (written at the end of every run) and the
+    latest ranking timestamp (written by ranking-only refreshes).
+    """
+    global _version_cache
+
+    now = time.monotonic()
+    if _version_cache is not None and _version_cache[0] > now:
+        return _version_cache[1]
+
+    async with get_pool().acquire() as db:
+        async with db.execute(
+            """SELECT (SELECT MAX(run_time) FROM run_history) as run_time,
+                      (SELECT MAX(last_ranked_at) FROM events) as ranked_at"""
+        ) as cursor:
+            row = await cursor.fetchone()
+
+    version = f"{row['run_time']}|{row['ranked_at']}"
+    _version_cache = (now + VERSION_TTL, version)
+    return version
+
+
+async def _apply_etag(request: Request, response: Response, cache_control: str) -> None:
+    """
+    Set ETag/Cache-Control, raising a 304 (no body) when If-None-Match
+    matches the current ETag.
+
+    The ETag covers the data version (pipeline writes) and the cache
+    epoch (writes made through the API, e.g. archiving a trend).
+    """
+    version = f"{CACHE_EPOCH}|{await get_data_version()}"
+    etag = f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+
+    if etag in request.headers.get("if-none-match", ""):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+async def http_cache(request: Request, response: Response) -> None:
+    """FastAPI dependency: ETag plus a short max-age (pipeline-only data)."""
+    await _apply_etag(request, response, f"public, max-age={CACHE_MAX_AGE}")
+
+
+async def http_revalidate(request: Request, response: Response) -> None:
+    """
+    FastAPI dependency: ETag, but clients revalidate on every request.
+
+    For data the UI itself changes (trend archive/dismiss), so a refetch
+    right after a write never comes from the browser cache.
+    """
+    await _apply_etag(request, response, "no-cache")
+
+
+def raw_json_response(content: str | bytes, response: Response) -> Response:
+    """
+    Return precomputed JSON text without re-serializing it.
+
+    FastAPI doesn't merge dependency-set headers into a Response the
+    endpoint returns itself, so the caching headers are copied over.
+    """
+    headers = {
+        name: response.headers[name]
+        for name in ("etag", "cache-control")
+        if name in response.headers
+    }
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def invalidate_cache() -> None:
+    """
+    Drop all cached payloads.
+
+    Called after a write made from the API process (manual refresh,
+    ranking refresh). Writes from the scheduler are picked up through
+    the data version instead.
+    """
+    global CACHE_EPOCH, _version_cache
+
+    CACHE_EPOCH += 1
+    _version_cache = None
+    _payloads.clear()
+
+
+def ttl_cache(seconds: int = 30) -> Callable:
+    """
+    Cache an endpoint's return value for `seconds`.
+
+    Keyed by endpoint, its scalar arguments (path/query params), the
+    cache epoch and the data version, so new pipeline output is served
+    as soon as the version changes. Concurrent misses for the same key
+    await a single in-flight computation instead of all hitting the DB.
+
+    Decorated endpoints take their connection from the pool inside the
+    function, not from Depends(get_db): the shared computation can
+    outlive the request that started it (whose get_db connection is
+    returned on disconnect), and the data version lookup needs a pool
+    connection of its own.
+    """
+    def store(key: tuple, task: asyncio.Task) -> None:
+        _inflight.pop(key, None)
+        # Errors (e.g. 404s) are re-raised to the waiters, never cached
+        if task.cancelled() or task.exception() is not None:
+            return
+        _payloads[key] = (time.monotonic() + seconds, task.result())
+        _payloads.move_to_end(key)
+        while len(_payloads) > TTL_CACHE_MAX_ENTRIES:
+            _payloads.popitem(last=False)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            params = tuple(sorted(
+                (name, value) for name, value in kwargs.items()
+                if value is None or isinstance(value, (str, int, float, bool))
+            ))
+            key = (func.__qualname__, params, CACHE_EPOCH, await get_data_version())
+
+            cached = _payloads.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                _payloads.move_to_end(key)
+                return cached[1]
+
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                task.add_done_callback(functools.partial(store, key))
+                _inflight[key] = task
+
+            # Shielded so one cancelled waiter doesn't cancel it for the rest
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+"""
+Pipeline Jobs
+
+Runs manually triggered pipelines in a separate OS process, so a long
+crawl + LLM run can't starve API requests or die with a worker reload.
+The child is the pipeline CLI (python -m processor.pipeline), the same
+entry point used for manual runs. Results land in run_history as usual.
+
+Usage:
+    job_id = await start_pipeline_job()
+    job = get_job(job_id)  # {"id": ..., "status": "running", ...}
+"""
+import asyncio
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+
+
+# Backend root, so `-m processor.pipeline` resolves
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Finished jobs kept for /runs/task/{task_id} (oldest dropped first)
+MAX_FINISHED_JOBS = 20
+
+# Jobs started by this process: job_id -> job info (in start order)
+_jobs: dict[str, dict] = {}
+
+# Watcher tasks, referenced so they aren't garbage collected
+_watchers: set[asyncio.Task] = set()
+
+
+def _status(job: dict) -> str:
+    returncode = job["process"].returncode
+    if returncode is None:
+        return "running"
+    return "succeeded" if returncode == 0 else "failed"
+
+
+def _running_job() -> Optional[dict]:
+    for job in _jobs.values():
+        if _status(job) == "running":
+            return job
+    return None
+
+
+def _prune_finished_jobs() -> None:
+    """Forget all but the MAX_FINISHED_JOBS most recent finished jobs."""
+    finished = [job_id for job_id, job in _jobs.items() if _status(job) != "running"]
+    excess = len(finished) - MAX_FINISHED_JOBS
+    for job_id in finished[:max(0, excess)]:
+        del _jobs[job_id]
+
+
+async def start_pipeline_job(
+    rank_only: bool = False,
+    on_exit: Optional[Callable[[], None]] = None
+) -> str:
+    """
+    Start the pipeline in a subprocess and return its job id.
+
+    Only one job runs at a time; if one is already running its id is
+    returned instead of starting another.
+
+    Args:
+        rank_only: Run only the ranking layer
+        on_exit: Called when the process exits (e.g. cache invalidation)
+    """
+    running = _running_job()
+    if running:
+        return running["id"]
+
+    _prune_finished_jobs()
+
+    args = [sys.executable, "-m", "processor.pipeline"]
+    if rank_only:
+        args.append("--rank-only")
+
+    # stdout carries the CLI's JSON summary; logs go to stderr/log files
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=str(BACKEND_DIR),
+        stdout=asyncio.subprocess.DEVNULL,
+    )
+
+    job_id = f"job_{uuid.uuid4().hex[:12]}"
+    _jobs[job_id] = {
+        "id": job_id,
+        "process": process,
+        "started_at": datetime.now().isoformat(),
+        "finished_at": None,
+    }
+    logger.info(f"Started pipeline job {job_id} (pid {process.pid})")
+
+    async def _watch():
+        await process.wait()
+        _jobs[job_id]["finished_at"] = datetime.now().isoformat()
+        logger.info(f"Pipeline job {job_id} exited with code {process.returncode}")
+        if on_exit:
+            on_exit()
+
+    task = asyncio.create_task(_watch())
+    _watchers.add(task)
+    task.add_done_callback(_watchers.discard)
+
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[dict]:
+    """Get status of a job started by this process."""
+    job = _jobs.get(job_id)
+    if job is None:
+        return None
+
+    return {
+        "id": job["id"],
+        "status": _status(job),
+        "returncode": job["process"].returncode,
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+    }
@@ -4,9 +4,11 @@ FastAPI Application - Market Intelligence Dashboard API
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config import ensure_directories
-from database import init_engine
+from database import init_engine, init_pool, close_pool
 from database.init import run_migrations
 from utils import logger, init_logging
 from .routes import router
@@ -26,16 +28,20 @@ async def lifespan(app: FastAPI):
     logger.info("Starting API server")
     
     await init_engine()
+    await init_pool()
     yield
     # Shutdown
     logger.info("Shutting down API server")
+    await close_pool()
 
 
 app = FastAPI(
     title="Market Intelligence Dashboard",
     description="API for Vietnam and Global macro/financial news analysis",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large row lists several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -47,6 +53,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip middleware - repetitive JSON (dashboard, event lists) compresses 5-10x
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routes
 app.include_router(router, prefix="/api")
 
@@ -18,18 +18,69 @@ The /trends endpoints provide a unified view combining themes and signals.
 Frontend should use /trends for the main dashboard, while /themes and /signals
 remain available for backward compatibility.
 """
+import asyncio
+import base64
 import json
-import math
+from collections import defaultdict
 from datetime import datetime, date, timedelta
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+import aiosqlite
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Query, Depends, Response
+from fastapi.responses import ORJSONResponse
 
 from config import settings
-from database import get_connection, INDICATOR_GROUPS
+from database import get_db, get_write_db, get_pool, INDICATOR_GROUPS
+from repositories.indicators import group_indicators, INDICATOR_LIST_COLUMNS
+from repositories.insights.theme import classify_category, compute_priority_score
+from repositories.kv_cache import INDICATORS_GROUPED_KEY, OTHER_NEWS_COUNT_KEY
+from .caching import http_cache, http_revalidate, ttl_cache, invalidate_cache, raw_json_response
+from .jobs import start_pipeline_job, get_job
 
 router = APIRouter()
 
 
+def _maybe_json(value):
+    """
+    Parse a JSON object/array text column, returning anything else as-is.
+    
+    Only text starting with '{' or '[' is parsed, so NULLs, empty and
+    plain strings skip the parser (and exception handling) entirely.
+    orjson is several times faster than json for the JSON fields parsed
+    on every list request; json is kept as fallback for NaN/Infinity,
+    which json.dumps writes but orjson rejects. Malformed JSON is
+    returned unparsed.
+    """
+    if not isinstance(value, str) or value[:1] not in ('{', '['):
+        return value
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+
+
+async def _fetch_dicts(cursor: aiosqlite.Cursor) -> list[dict]:
+    """
+    Read the remaining rows of a cursor as dicts.
+    
+    Rows come back as plain tuples and are zipped with the column names
+    read once from the description, which is cheaper than building
+    sqlite3.Row objects and copying each one with dict(row).
+    """
+    cursor.row_factory = None
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) async for row in cursor]
+
+
+async def _with_pooled_connection(fetch):
+    """Run a fetch coroutine on its own pooled connection."""
+    async with get_pool().acquire() as db:
+        return await fetch(db)
+
+
 # ============================================================
 # Health Check
 # ============================================================
@@ -38,7 +89,7 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "database": str(settings.DATABASE_PATH)
     }
 
@@ -46,86 +97,110 @@ async def health_check():
 # ============================================================
 # Indicators
 # ============================================================
-@router.get("/indicators")
+@router.get("/indicators", dependencies=[Depends(http_cache)])
 async def list_indicators(
+    response: Response,
     category: Optional[str] = None,
-    grouped: bool = Query(default=True, description="Group indicators by category")
+    grouped: bool = Query(default=True, description="Group indicators by category"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """
     List all indicators.
     
     If grouped=True, returns indicators organized by category groups.
+    The grouped payload is precomputed by the pipeline (kv_cache) and
+    served as-is; it is only built here if the pipeline hasn't run yet.
     """
-    conn = get_connection(settings.DATABASE_PATH)
+    if grouped and not category:
+        async with db.execute(
+            "SELECT value FROM kv_cache WHERE key = ?",
+            (INDICATORS_GROUPED_KEY,)
+        ) as cursor:
+            cached = await cursor.fetchone()
+        if cached and cached['value']:
+            return raw_json_response(cached['value'], response)
     
     if category:
-        cursor = conn.execute(
-            "SELECT * FROM indicators WHERE category = ? ORDER BY name",
-            (category,)
-        )
+        query = f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators WHERE category = ? ORDER BY name"
+        params = (category,)
     else:
-        cursor = conn.execute("SELECT * FROM indicators ORDER BY category, name")
-    
-    rows = cursor.fetchall()
-    conn.close()
+        query = f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators ORDER BY category, name"
+        params = ()
     
-    indicators = [dict(row) for row in rows]
+    async with db.execute(query, params) as cursor:
+        indicators = await _fetch_dicts(cursor)
     
     # Parse attributes JSON for indicators that have it
-    import json as _json
     for ind in indicators:
-        if ind.get('attributes'):
-            try:
-                ind['attributes'] = _json.loads(ind['attributes'])
-            except (ValueError, TypeError):
-                pass
+        ind['attributes'] = _maybe_json(ind['attributes'])
     
     if grouped and not category:
-        # Group by category
-        grouped_data = {}
-        for group_id, group_info in INDICATOR_GROUPS.items():
-            group_result = {
-                "display_name": group_info["display_name"],
-                "indicators": [
-                    ind for ind in indicators 
-                    if ind.get('category') == group_id or ind.get('id') in group_info.get("indicators", [])
-                ]
-            }
-            # Pass expandable metadata for gold group
-            if group_info.get("expandable"):
-                group_result["expandable"] = True
-                group_result["primary_indicators"] = group_info.get("primary_indicators", [])
-            grouped_data[group_id] = group_result
-        return {"groups": grouped_data, "total": len(indicators)}
+        return group_indicators(indicators)
     
     return {"indicators": indicators}
 
 
+@router.get("/indicators/history")
+async def get_indicators_history_batch(
+    ids: str = Query(description="Comma-separated indicator IDs"),
+    days: int = Query(default=30, le=365, description="Number of days of history"),
+    db: aiosqlite.Connection = Depends(get_db)
+):
+    """
+    Get history for several indicators in one call.
+    
+    Same per-indicator window as /indicators/{id}/history (latest `days`
+    records each), fetched with a single query instead of one request
+    per chart.
+    """
+    indicator_ids = [i.strip() for i in ids.split(',') if i.strip()]
+    if not indicator_ids:
+        raise HTTPException(status_code=400, detail="No indicator ids given")
+    
+    async with db.execute(
+        """SELECT * FROM (
+               SELECT *, ROW_NUMBER() OVER (
+                   PARTITION BY indicator_id ORDER BY date DESC
+               ) as rn
+               FROM indicator_history
+               WHERE indicator_id IN (SELECT value FROM json_each(?))
+           )
+           WHERE rn <= ?
+           ORDER BY indicator_id, date DESC""",
+        (json.dumps(indicator_ids), days)
+    ) as cursor:
+        rows = await cursor.fetchall()
+    
+    history = {indicator_id: [] for indicator_id in indicator_ids}
+    for row in rows:
+        record = dict(row)
+        del record['rn']
+        history[record['indicator_id']].append(record)
+    
+    return {"history": history, "days": days}
+
+
 @router.get("/indicators/{indicator_id}")
-async def get_indicator(indicator_id: str):
+async def get_indicator(indicator_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single indicator with recent history."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
     # Get current value
-    cursor = conn.execute("SELECT * FROM indicators WHERE id = ?", (indicator_id,))
-    row = cursor.fetchone()
+    async with db.execute("SELECT * FROM indicators WHERE id = ?", (indicator_id,)) as cursor:
+        row = await cursor.fetchone()
     
     if not row:
-        conn.close()
         raise HTTPException(status_code=404, detail="Indicator not found")
     
     result = dict(row)
     
     # Get recent history (last 30 records)
-    cursor = conn.execute(
+    async with db.execute(
         """SELECT * FROM indicator_history 
            WHERE indicator_id = ? 
            ORDER BY date DESC 
            LIMIT 30""",
         (indicator_id,)
-    )
-    history = [dict(r) for r in cursor.fetchall()]
-    conn.close()
+    ) as cursor:
+        history = await _fetch_dicts(cursor)
     
     result["history"] = history
     return result
@@ -134,95 +209,140 @@ async def get_indicator(indicator_id: str):
 @router.get("/indicators/{indicator_id}/history")
 async def get_indicator_history(
     indicator_id: str,
-    days: int = Query(default=30, le=365, description="Number of days of history")
+    days: int = Query(default=30, le=365, description="Number of days of history"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """Get indicator history for charts."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
+    async with db.execute(
         """SELECT * FROM indicator_history 
            WHERE indicator_id = ? 
            ORDER BY date DESC 
            LIMIT ?""",
         (indicator_id, days)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
     if not rows:
         raise HTTPException(status_code=404, detail="No history found")
     
     return {
         "indicator_id": indicator_id,
-        "history": [dict(row) for row in rows],
+        "history": rows,
         "count": len(rows)
     }
 
 
 @router.get("/indicators/category/{category}")
-async def list_indicators_by_category(category: str):
+async def list_indicators_by_category(category: str, db: aiosqlite.Connection = Depends(get_db)):
     """List indicators by category (vietnam_monetary, vietnam_forex, etc)."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        "SELECT * FROM indicators WHERE category = ? ORDER BY name",
+    async with db.execute(
+        f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators WHERE category = ? ORDER BY name",
         (category,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return {"indicators": [dict(row) for row in rows], "category": category}
-    
-    return {"indicators": [dict(row) for row in rows]}
-
-
-@router.get("/indicators/{indicator_id}")
-async def get_indicator(indicator_id: str):
-    """Get single indicator by ID."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute("SELECT * FROM indicators WHERE id = ?", (indicator_id,))
-    row = cursor.fetchone()
-    conn.close()
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    if not row:
-        raise HTTPException(status_code=404, detail="Indicator not found")
-    
-    return dict(row)
+    return {"indicators": rows, "category": category}
 
 
 @router.get("/indicators/region/{region}")
 async def list_indicators_by_region(
     region: str,
-    limit: int = Query(default=50, le=200)
+    limit: int = Query(default=50, le=200),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List indicators by region (vietnam/global)."""
-    category_prefix = "vietnam" if region == "vietnam" else "global"
+    region = "vietnam" if region == "vietnam" else "global"
     
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        "SELECT * FROM indicators WHERE category LIKE ? ORDER BY updated_at DESC LIMIT ?",
-        (f"{category_prefix}%", limit)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(
+        f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators WHERE region = ? ORDER BY updated_at DESC LIMIT ?",
+        (region, limit)
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"indicators": [dict(row) for row in rows]}
+    return {"indicators": rows}
 
 
 # ============================================================
 # Events
 # ============================================================
-@router.get("/events")
+# Columns returned by event list views (EventList cards). The full
+# article content, score breakdown and ranking bookkeeping are only
+# needed by the detail view, /events/{event_id}.
+EVENT_LIST_COLUMNS = """id, title, summary, source, source_url, category, region,
+    linked_indicators, base_score, current_score, display_section,
+    hot_topic, is_follow_up, published_at, run_date"""
+
+# Static queries shared by /events/key and /dashboard, built once so every
+# request sends the same text and hits the connection's statement cache
+SQL_KEY_EVENTS = f"""SELECT {EVENT_LIST_COLUMNS} FROM events 
+    WHERE display_section = 'key_events' 
+    ORDER BY current_score DESC 
+    LIMIT 15"""
+
+# Columns embedded as JSON objects by get_event
+CAUSAL_ANALYSIS_COLUMNS = (
+    'id', 'event_id', 'template_id', 'chain_steps', 'confidence',
+    'needs_investigation', 'affected_indicators', 'impact_on_vn',
+    'reasoning', 'created_at', 'updated_at',
+)
+CAUSAL_ANALYSIS_JSON_COLUMNS = ('chain_steps', 'affected_indicators')
+SIGNAL_COLUMNS = (
+    'id', 'prediction', 'direction', 'target_indicator', 'target_range_low',
+    'target_range_high', 'confidence', 'timeframe_days', 'expires_at',
+    'source_event_ids', 'source_event_id', 'reasoning', 'status',
+    'actual_value', 'verified_at', 'accuracy_notes', 'theme_id',
+    'created_at', 'updated_at', 'signal_type',
+)
+
+
+def _encode_cursor(*values) -> str:
+    """Opaque pagination cursor holding the last row's sort key."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> list:
+    """Decode a cursor from _encode_cursor, 400 if it's malformed."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _valid_json_sql(column: str) -> str:
+    """SQL expression: the column's text if it holds valid JSON, else NULL."""
+    return f"CASE WHEN json_valid({column}) THEN {column} END"
+
+
+def _json_object_sql(alias: str, columns: tuple, json_columns: tuple = ()) -> str:
+    """
+    Build a json_object(...) SQL expression over the given columns.
+    
+    Columns in json_columns hold JSON text and are embedded as JSON
+    (when valid) rather than as strings.
+    """
+    values = []
+    for col in columns:
+        value = f"{alias}.{col}"
+        if col in json_columns:
+            value = f"CASE WHEN json_valid({value}) THEN json({value}) ELSE {value} END"
+        values.append(f"'{col}', {value}")
+    return "json_object(" + ", ".join(values) + ")"
+
+
+@router.get("/events", dependencies=[Depends(http_cache)])
 async def list_events(
     category: Optional[str] = None,
     region: Optional[str] = None,
     display_section: Optional[str] = Query(default=None, description="key_events, other_news, archive"),
     limit: int = Query(default=50, le=200),
-    offset: int = 0
+    offset: int = 0,
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List events with optional filters."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    query = "SELECT * FROM events WHERE 1=1"
+    query = f"SELECT {EVENT_LIST_COLUMNS} FROM events WHERE 1=1"
     params = []
     
     if category:
@@ -238,140 +358,150 @@ async def list_events(
     query += " ORDER BY current_score DESC, published_at DESC LIMIT ? OFFSET ?"
     params.extend([limit, offset])
     
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        events = await _fetch_dicts(cursor)
     
     return {
-        "events": [dict(row) for row in rows],
+        "events": events,
         "limit": limit,
         "offset": offset
     }
 
 
-@router.get("/events/key")
-async def get_key_events():
+@router.get("/events/key", dependencies=[Depends(http_cache)])
+async def get_key_events(db: aiosqlite.Connection = Depends(get_db)):
     """Get key events (high-scoring, market-moving)."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        """SELECT * FROM events 
-           WHERE display_section = 'key_events' 
-           ORDER BY current_score DESC 
-           LIMIT 15"""
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(SQL_KEY_EVENTS) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"events": [dict(row) for row in rows]}
+    return {"events": rows}
 
 
-@router.get("/events/other")
+@router.get("/events/other", dependencies=[Depends(http_cache)])
 async def get_other_news(
     limit: int = Query(default=30, le=100),
-    offset: int = 0
+    offset: int = 0,
+    after: Optional[str] = Query(default=None, alias="cursor", description="next_cursor from the previous page"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
-    """Get other news (sorted by date, newest first)."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        """SELECT * FROM events 
+    """
+    Get other news (sorted by date, newest first).
+    
+    Page with `cursor` (the previous response's next_cursor): it seeks
+    straight to the next row via the index, where OFFSET reads and
+    discards every skipped row. `offset` is still accepted without a
+    cursor.
+    
+    Events without published_at sort last; the sort key is
+    COALESCE(published_at, '') so the cursor can seek past them too.
+    """
+    if after:
+        published_at, event_id = _decode_cursor(after, 2)
+        query = f"""SELECT {EVENT_LIST_COLUMNS} FROM events 
            WHERE display_section = 'other_news' 
-           ORDER BY published_at DESC 
-           LIMIT ? OFFSET ?""",
-        (limit, offset)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+           AND COALESCE(published_at, '') <= ?
+           AND (COALESCE(published_at, ''), id) < (?, ?)
+           ORDER BY COALESCE(published_at, '') DESC, id DESC 
+           LIMIT ?"""
+        # The <= bound is redundant but lets SQLite seek the expression
+        # index (it doesn't seek on a row value over an expression)
+        params = (published_at, published_at, event_id, limit)
+    else:
+        query = f"""SELECT {EVENT_LIST_COLUMNS} FROM events 
+           WHERE display_section = 'other_news' 
+           ORDER BY COALESCE(published_at, '') DESC, id DESC 
+           LIMIT ? OFFSET ?"""
+        params = (limit, offset)
+    
+    async with db.execute(query, params) as cursor:
+        events = await _fetch_dicts(cursor)
     
-    return {"events": [dict(row) for row in rows], "limit": limit, "offset": offset}
+    next_cursor = None
+    if len(events) == limit:
+        next_cursor = _encode_cursor(events[-1]['published_at'] or '', events[-1]['id'])
+    
+    return {
+        "events": events,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor
+    }
 
 
 @router.get("/events/today")
-async def get_today_events():
+async def get_today_events(db: aiosqlite.Connection = Depends(get_db)):
     """Get today's events only."""
     today = date.today().isoformat()
     
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        "SELECT * FROM events WHERE run_date = ? ORDER BY current_score DESC",
+    async with db.execute(
+        f"SELECT {EVENT_LIST_COLUMNS} FROM events WHERE run_date = ? ORDER BY current_score DESC",
         (today,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"events": [dict(row) for row in rows], "date": today}
+    return {"events": rows, "date": today}
 
 
 @router.get("/events/{event_id}")
-async def get_event(event_id: str):
+async def get_event(event_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single event with full analysis."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    # Get event
-    cursor = conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-    event = cursor.fetchone()
+    # Event, causal analysis and related signals in one round-trip.
+    # Nested rows and valid JSON columns come back as JSON text built by
+    # SQLite and are embedded verbatim (orjson.Fragment), skipping a
+    # json.loads + re-serialize per field.
+    async with db.execute(
+        f"""SELECT e.*,
+                  {_valid_json_sql('e.linked_indicators')} as linked_indicators_json,
+                  {_valid_json_sql('e.score_factors')} as score_factors_json,
+                  (SELECT {_json_object_sql('c', CAUSAL_ANALYSIS_COLUMNS, CAUSAL_ANALYSIS_JSON_COLUMNS)}
+                   FROM causal_analyses c
+                   WHERE c.event_id = e.id
+                   LIMIT 1) as causal_analysis_json,
+                  (SELECT json_group_array({_json_object_sql('s', SIGNAL_COLUMNS)})
+                   FROM signals s
+                   WHERE s.source_event_id = e.id) as related_signals_json
+           FROM events e
+           WHERE e.id = ?""",
+        (event_id,)
+    ) as cursor:
+        event = await cursor.fetchone()
     
     if not event:
-        conn.close()
         raise HTTPException(status_code=404, detail="Event not found")
     
     result = dict(event)
     
-    # Parse JSON fields
-    if result.get('linked_indicators'):
-        try:
-            result['linked_indicators'] = json.loads(result['linked_indicators'])
-        except:
-            pass
-    if result.get('score_factors'):
-        try:
-            result['score_factors'] = json.loads(result['score_factors'])
-        except:
-            pass
+    # JSON fields (left as the raw string if malformed)
+    for field in ['linked_indicators', 'score_factors']:
+        raw_json = result.pop(f'{field}_json')
+        if raw_json:
+            result[field] = orjson.Fragment(raw_json)
     
-    # Get causal analysis
-    cursor = conn.execute(
-        "SELECT * FROM causal_analyses WHERE event_id = ?",
-        (event_id,)
-    )
-    analysis = cursor.fetchone()
-    if analysis:
-        analysis_dict = dict(analysis)
-        # Parse JSON fields in analysis
-        for field in ['chain_steps', 'affected_indicators']:
-            if analysis_dict.get(field):
-                try:
-                    analysis_dict[field] = json.loads(analysis_dict[field])
-                except:
-                    pass
-        result["causal_analysis"] = analysis_dict
+    # Causal analysis
+    analysis_json = result.pop('causal_analysis_json')
+    if analysis_json:
+        result["causal_analysis"] = orjson.Fragment(analysis_json)
     
-    # Get related signals
-    cursor = conn.execute(
-        """SELECT * FROM signals 
-           WHERE source_event_id = ?""",
-        (event_id,)
-    )
-    signals = [dict(r) for r in cursor.fetchall()]
-    if signals:
-        result["related_signals"] = signals
+    # Related signals
+    signals_json = result.pop('related_signals_json')
+    if signals_json and signals_json != '[]':
+        result["related_signals"] = orjson.Fragment(signals_json)
     
-    conn.close()
-    return result
+    # Returned directly: jsonable_encoder can't handle Fragments
+    return ORJSONResponse(result)
 
 
 # ============================================================
 # Causal Analysis
 # ============================================================
 @router.get("/analysis/{event_id}")
-async def get_causal_analysis(event_id: str):
+async def get_causal_analysis(event_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get causal chain analysis for an event."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
+    async with db.execute(
         "SELECT * FROM causal_analyses WHERE event_id = ?",
         (event_id,)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    ) as cursor:
+        row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(status_code=404, detail="Analysis not found")
@@ -386,103 +516,92 @@ async def get_causal_analysis(event_id: str):
 # ============================================================
 @router.get("/signals")
 async def list_signals(
-    status: Optional[str] = Query(default=None, description="active, verified_correct, verified_wrong, expired")
+    status: Optional[str] = Query(default=None, description="active, verified_correct, verified_wrong, expired"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List signals, defaults to active."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
     if status == "all":
-        cursor = conn.execute(
-            """SELECT s.*, e.title as source_event_title
-               FROM signals s
-               LEFT JOIN events e ON s.source_event_id = e.id
-               ORDER BY s.created_at DESC"""
-        )
+        query = """SELECT s.*, e.title as source_event_title
+                   FROM signals s
+                   LEFT JOIN events e ON s.source_event_id = e.id
+                   ORDER BY s.created_at DESC"""
+        params = ()
     elif status:
-        cursor = conn.execute(
-            """SELECT s.*, e.title as source_event_title
-               FROM signals s
-               LEFT JOIN events e ON s.source_event_id = e.id
-               WHERE s.status = ?
-               ORDER BY s.created_at DESC""",
-            (status,)
-        )
+        query = """SELECT s.*, e.title as source_event_title
+                   FROM signals s
+                   LEFT JOIN events e ON s.source_event_id = e.id
+                   WHERE s.status = ?
+                   ORDER BY s.created_at DESC"""
+        params = (status,)
     else:
         # Default: active
-        cursor = conn.execute(
-            """SELECT s.*, e.title as source_event_title
-               FROM signals s
-               LEFT JOIN events e ON s.source_event_id = e.id
-               WHERE s.status = 'active'
-               AND (s.expires_at IS NULL OR s.expires_at > datetime('now'))
-               ORDER BY 
-                   CASE s.confidence WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
-                   s.created_at DESC"""
-        )
+        query = """SELECT s.*, e.title as source_event_title
+                   FROM signals s
+                   LEFT JOIN events e ON s.source_event_id = e.id
+                   WHERE s.status = 'active'
+                   AND (s.expires_at IS NULL OR s.expires_at > datetime('now'))
+                   ORDER BY 
+                       CASE s.confidence WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
+                       s.created_at DESC"""
+        params = ()
     
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        signals = await _fetch_dicts(cursor)
     
-    return {"signals": [dict(row) for row in rows]}
+    return {"signals": signals}
 
 
 @router.get("/signals/{signal_id}")
-async def get_signal(signal_id: str):
+async def get_signal(signal_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single signal with details."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
+    async with db.execute(
         """SELECT s.*, e.title as source_event_title
            FROM signals s
            LEFT JOIN events e ON s.source_event_id = e.id
            WHERE s.id = ?""",
         (signal_id,)
-    )
-    sig = cursor.fetchone()
+    ) as cursor:
+        sig = await cursor.fetchone()
     
     if not sig:
-        conn.close()
         raise HTTPException(status_code=404, detail="Signal not found")
     
     result = dict(sig)
     
     # Get source event details
     if sig["source_event_id"]:
-        cursor = conn.execute(
+        async with db.execute(
             "SELECT * FROM events WHERE id = ?",
             (sig["source_event_id"],)
-        )
-        source_event = cursor.fetchone()
+        ) as cursor:
+            source_event = await cursor.fetchone()
         if source_event:
             result["source_event"] = dict(source_event)
     
     # Get theme if linked
     if sig["theme_id"]:
-        cursor = conn.execute(
+        async with db.execute(
             "SELECT * FROM themes WHERE id = ?",
             (sig["theme_id"],)
-        )
-        theme = cursor.fetchone()
+        ) as cursor:
+            theme = await cursor.fetchone()
         if theme:
             result["theme"] = dict(theme)
     
-    conn.close()
     return result
 
 
 @router.get("/signals/accuracy")
-async def get_signal_accuracy():
+async def get_signal_accuracy(db: aiosqlite.Connection = Depends(get_db)):
     """Get signal accuracy statistics."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
+    async with db.execute(
         """SELECT * FROM signal_accuracy_stats 
            ORDER BY calculated_at DESC 
            LIMIT 10"""
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"accuracy_stats": [dict(row) for row in rows]}
+    return {"accuracy_stats": rows}
 
 
 # ============================================================
@@ -492,191 +611,125 @@ async def get_signal_accuracy():
 # ============================================================
 @router.get("/themes")
 async def list_themes(
-    status: Optional[str] = Query(default=None, description="emerging, active, fading, archived")
+    status: Optional[str] = Query(default=None, description="emerging, active, fading, archived"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List themes, defaults to active and emerging."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
     if status == "all":
-        cursor = conn.execute(
-            """SELECT * FROM themes 
-               ORDER BY strength DESC, event_count DESC"""
-        )
+        query = """SELECT * FROM themes 
+                   ORDER BY strength DESC, event_count DESC"""
+        params = ()
     elif status:
-        cursor = conn.execute(
-            """SELECT * FROM themes 
-               WHERE status = ?
-               ORDER BY strength DESC""",
-            (status,)
-        )
+        query = """SELECT * FROM themes 
+                   WHERE status = ?
+                   ORDER BY strength DESC"""
+        params = (status,)
     else:
         # Default: active and emerging
-        cursor = conn.execute(
-            """SELECT * FROM themes 
-               WHERE status IN ('active', 'emerging')
-               ORDER BY strength DESC, event_count DESC"""
-        )
+        query = """SELECT * FROM themes 
+                   WHERE status IN ('active', 'emerging')
+                   ORDER BY strength DESC, event_count DESC"""
+        params = ()
     
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"themes": [dict(row) for row in rows]}
+    return {"themes": rows}
 
 
 @router.get("/themes/{theme_id}")
-async def get_theme(theme_id: str):
+async def get_theme(theme_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single theme with related events and signals."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
+    async with db.execute(
         "SELECT * FROM themes WHERE id = ?",
         (theme_id,)
-    )
-    theme = cursor.fetchone()
+    ) as cursor:
+        theme = await cursor.fetchone()
     
     if not theme:
-        conn.close()
         raise HTTPException(status_code=404, detail="Theme not found")
     
     result = dict(theme)
     
     # Parse JSON fields
-    if result.get('related_event_ids'):
-        try:
-            result['related_event_ids'] = json.loads(result['related_event_ids'])
-        except:
-            pass
+    result['related_event_ids'] = _maybe_json(result['related_event_ids'])
     
     # Get related signals
-    cursor = conn.execute(
+    async with db.execute(
         """SELECT * FROM signals 
            WHERE theme_id = ?
            ORDER BY created_at DESC""",
         (theme_id,)
-    )
-    signals = [dict(r) for r in cursor.fetchall()]
+    ) as cursor:
+        signals = await _fetch_dicts(cursor)
     result["signals"] = signals
     
-    conn.close()
     return result
 
 
 # ============================================================
-# Trends: Priority Score + Category Helpers
+# Trends (Unified view: Themes + Signals)
+# ============================================================
+# NEW ENDPOINT: Replaces separate /themes and /signals for dashboard
+# Frontend: TrendsPanel uses this as main data source
+# Concept: Each "Trend" is a Theme with computed signal stats
 # ============================================================
 
-# Category keywords for auto-classification of themes by name.
-# Order matters: first match wins. More specific patterns first.
-CATEGORY_KEYWORDS = {
-    'gold': ['vàng', 'gold', 'kim loại quý', 'bạc tích trữ'],
-    'monetary': ['lãi suất', 'tiền tệ', 'ngân hàng trung ương', 'omo', 'thanh khoản',
-                 'tín phiếu', 'huy động', 'tiền gửi', 'fed', 'deposit rate', 'interbank',
-                 'tái cơ cấu ngân hàng', 'tăng trưởng ngân hàng'],
-    'trade': ['thương mại', 'thuế quan', 'tariff', 'trade', 'xuất khẩu', 'nhập khẩu',
-              'bảo hộ', 'trừng phạt'],
-    'forex': ['tỷ giá', 'usd/vnd', 'forex', 'ngoại hối', 'đô la', 'nhân dân tệ',
-              'yên', 'đồng', 'dxy'],
-    'equity': ['chứng khoán', 'cổ phiếu', 'vnindex', 'nâng hạng', 'ipo', 'quỹ ngoại',
-               'danh mục'],
-    'energy': ['năng lượng', 'dầu', 'oil', 'gas', 'điện', 'xăng'],
-    'geopolitics': ['địa chính trị', 'quân sự', 'trung đông', 'chiến tranh', 'leo thang',
-                    'xung đột'],
-    'realestate': ['bất động sản', 'nhà ở', 'metro', 'hạ tầng', 'đô thị'],
-    'tech': ['ai ', 'công nghệ', 'chuyển đổi số', 'bán dẫn', 'fdi công nghệ'],
-    'agriculture': ['nông sản', 'nông nghiệp', 'thực phẩm', 'gạo', 'cà phê'],
-    'macro': ['gdp', 'cpi', 'lạm phát', 'tăng trưởng', 'kinh tế vĩ mô', 'tài khóa',
-              'đầu tư công', 'phục hồi kinh tế', 'du lịch'],
-    'fiscal': ['thuế', 'ngân sách', 'thuế suất', 'tuân thủ thuế'],
-}
-
-
-def _classify_category(name: str) -> str:
-    """Classify a theme into a category based on name keywords."""
-    name_lower = (name or '').lower()
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in name_lower:
-                return category
-    return 'other'
-
-
-def _compute_priority_score(trend: dict) -> float:
+async def _fetch_trends_summary(
+    db: aiosqlite.Connection,
+    signals_only: bool = False
+) -> dict:
     """
-    Compute composite priority score (0-100) for a trend.
-    
-    Components:
-    - Signal density (30%): More active signals = more important
-    - Average confidence (25%): high > medium > low
-    - Strength (15%): Theme strength from LLM
-    - Time urgency (15%): Days until earliest signal expires
-    - Evidence breadth (15%): More events = more evidence
+    Theme counts and overall signal accuracy in one query.
     
-    This score determines which trends appear in "Today's Focus".
+    Args:
+        signals_only: Count only themes with active signals (urgency set)
     """
-    signals = trend.get('signals', [])
-    active_signals = [s for s in signals if s.get('status') == 'active']
-    sig_count = len(active_signals)
-    
-    # 1. Signal density (0-30): logarithmic scale, diminishing returns after ~10
-    # 1 signal → ~9, 5 signals → ~21, 10 → ~27, 43 → ~30
-    sig_score = min(30, math.log2(sig_count + 1) / math.log2(50) * 30) if sig_count > 0 else 0
-    
-    # 2. Average confidence (0-25)
-    conf_map = {'high': 3, 'medium': 2, 'low': 1}
-    if active_signals:
-        avg_conf = sum(conf_map.get(s.get('confidence', 'low'), 1) for s in active_signals) / len(active_signals)
-    else:
-        avg_conf = 1
-    conf_score = (avg_conf / 3.0) * 25
-    
-    # 3. Strength (0-15)
-    strength = trend.get('strength', 0) or 0
-    strength_score = min(strength, 1.0) * 15
-    
-    # 4. Time urgency (0-15): inverted — sooner expiry = higher score
-    expires = trend.get('earliest_signal_expires')
-    if expires:
-        try:
-            exp_dt = datetime.fromisoformat(str(expires).replace('Z', '+00:00'))
-            days_left = max(0, (exp_dt.replace(tzinfo=None) - datetime.now()).total_seconds() / 86400)
-        except:
-            days_left = 14
-    else:
-        days_left = 14
-    
-    if days_left < 1:
-        time_score = 15
-    elif days_left < 3:
-        time_score = 12
-    elif days_left < 7:
-        time_score = 8
-    else:
-        time_score = 4
+    urgency_filter = "AND urgency IS NOT NULL" if signals_only else ""
+    async with db.execute(
+        f"""SELECT t.*, a.correct, a.total_verified
+           FROM (
+               SELECT 
+                   COUNT(*) as total,
+                   COUNT(*) FILTER (WHERE urgency = 'urgent') as urgent_count,
+                   COUNT(*) FILTER (WHERE urgency = 'watching') as watching_count,
+                   COUNT(*) FILTER (WHERE signals_count > 0) as with_signals_count
+               FROM themes
+               WHERE status IN ('active', 'emerging')
+               {urgency_filter}
+           ) t, (
+               SELECT 
+                   COUNT(*) FILTER (WHERE status = 'verified_correct') as correct,
+                   COUNT(*) as total_verified
+               FROM signals
+               WHERE status IN ('verified_correct', 'verified_wrong')
+           ) a"""
+    ) as cursor:
+        row = dict(await cursor.fetchone())
     
-    # 5. Evidence breadth (0-15): logarithmic
-    event_count = trend.get('event_count', 0) or 0
-    evidence_score = min(15, math.log2(event_count + 1) / math.log2(20) * 15) if event_count > 0 else 0
+    correct = row.pop('correct') or 0
+    total_verified = row.pop('total_verified') or 0
+    accuracy_pct = None
+    if total_verified > 0:
+        accuracy_pct = round(correct / total_verified * 100, 1)
     
-    total = sig_score + conf_score + strength_score + time_score + evidence_score
-    return round(total, 1)
-
+    return {
+        **row,
+        'signals_correct': correct,
+        'signals_total_verified': total_verified,
+        'signals_accuracy': accuracy_pct,
+    }
 
-# ============================================================
-# Trends (Unified view: Themes + Signals)
-# ============================================================
-# NEW ENDPOINT: Replaces separate /themes and /signals for dashboard
-# Frontend: TrendsPanel uses this as main data source
-# Concept: Each "Trend" is a Theme with computed signal stats
-# ============================================================
 
-@router.get("/trends")
+@router.get("/trends", dependencies=[Depends(http_revalidate)])
 async def list_trends(
     urgency: Optional[str] = Query(default=None, description="urgent, watching, low"),
     with_summary: bool = Query(default=True, description="Include summary stats"),
     include_fading: bool = Query(default=False, description="Include fading trends"),
     include_empty: bool = Query(default=False, description="Include themes with no active signals"),
     limit: int = Query(default=30, le=200, description="Max results to return."),
-    offset: int = Query(default=0, ge=0, description="Offset for pagination")
+    offset: int = Query(default=0, ge=0, description="Offset for pagination"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """
     List trends for dashboard - unified Themes + Signals view.
@@ -698,95 +751,101 @@ async def list_trends(
     - trends: Array of theme objects with signals loaded
     - summary: (if with_summary=true) Overall stats
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
     # Build query based on urgency filter
     if urgency:
-        cursor = conn.execute(
-            """SELECT t.*, 
-                      (SELECT COUNT(*) FROM signals s WHERE s.theme_id = t.id AND s.status = 'active') as active_signals_count
-               FROM themes t
-               WHERE t.urgency = ?
-               AND t.status IN ('active', 'emerging')
-               ORDER BY t.earliest_signal_expires ASC
-               LIMIT ? OFFSET ?""",
-            (urgency, limit, offset)
-        )
+        query = """SELECT t.*, 
+                          (SELECT COUNT(*) FROM signals s WHERE s.theme_id = t.id AND s.status = 'active') as active_signals_count
+                   FROM themes t
+                   WHERE t.urgency = ?
+                   AND t.status IN ('active', 'emerging')
+                   ORDER BY t.priority_score DESC, t.earliest_signal_expires ASC
+                   LIMIT ? OFFSET ?"""
+        params = (urgency, limit, offset)
     else:
-        # Default: all active/emerging, ordered by urgency then strength
+        # Default: all active/emerging, highest priority first (priority_score
+        # is kept up to date by the pipeline; NULLs sort last)
         # By default, exclude themes with no active signals (urgency IS NULL)
         # to focus the dashboard on actionable trends with predictions
         status_filter = "('active', 'emerging', 'fading')" if include_fading else "('active', 'emerging')"
         urgency_filter = "" if include_empty else "AND t.urgency IS NOT NULL"
-        cursor = conn.execute(
-            f"""SELECT t.*,
-                       (SELECT COUNT(*) FROM signals s WHERE s.theme_id = t.id AND s.status = 'active') as active_signals_count
-                FROM themes t
-                WHERE t.status IN {status_filter}
-                {urgency_filter}
-                ORDER BY 
-                    CASE t.urgency 
-                        WHEN 'urgent' THEN 1 
-                        WHEN 'watching' THEN 2 
-                        WHEN 'low' THEN 3 
-                        ELSE 4 
-                    END,
-                    t.earliest_signal_expires ASC,
-                    t.strength DESC
-                LIMIT ? OFFSET ?""",
-            (limit, offset)
-        )
+        query = f"""SELECT t.*,
+                           (SELECT COUNT(*) FROM signals s WHERE s.theme_id = t.id AND s.status = 'active') as active_signals_count
+                    FROM themes t
+                    WHERE t.status IN {status_filter}
+                    {urgency_filter}
+                    ORDER BY 
+                        t.priority_score DESC,
+                        CASE t.urgency 
+                            WHEN 'urgent' THEN 1 
+                            WHEN 'watching' THEN 2 
+                            WHEN 'low' THEN 3 
+                            ELSE 4 
+                        END,
+                        t.earliest_signal_expires ASC,
+                        t.strength DESC
+                    LIMIT ? OFFSET ?"""
+        params = (limit, offset)
+    
+    async with db.execute(query, params) as cursor:
+        trends_raw = [dict(row) for row in await cursor.fetchall()]
     
-    trends_raw = [dict(row) for row in cursor.fetchall()]
+    # Parse JSON fields
+    for trend in trends_raw:
+        for field in ['related_event_ids', 'related_signal_ids', 'related_indicators']:
+            trend[field] = _maybe_json(trend[field])
     
-    # Enrich each trend with its signals
+    # Active signals for all trends on the page in one query, bucketed by theme
+    # Signals past expires_at are automatically transitioned by recompute_trend_stats
+    signals_by_theme = defaultdict(list)
+    async with db.execute(
+        """SELECT * FROM signals 
+           WHERE theme_id IN (SELECT value FROM json_each(?)) AND status = 'active'
+           ORDER BY 
+               expires_at ASC,
+               CASE confidence WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
+               created_at DESC""",
+        (json.dumps([t['id'] for t in trends_raw]),)
+    ) as cursor:
+        async for s in cursor:
+            signals_by_theme[s['theme_id']].append(dict(s))
+    
+    # Related events (first 5 per trend), also fetched in one query and
+    # distributed in a single pass (rows stay newest first per trend)
+    themes_by_event = defaultdict(list)
+    for trend in trends_raw:
+        related = trend.get('related_event_ids')
+        if isinstance(related, list):
+            for event_id in set(related[:5]):
+                themes_by_event[event_id].append(trend['id'])
+    events_by_theme = defaultdict(list)
+    if themes_by_event:
+        async with db.execute(
+            """SELECT id, title, source, published_at, current_score 
+                FROM events 
+                WHERE id IN (SELECT value FROM json_each(?))
+                ORDER BY published_at DESC""",
+            (json.dumps(list(themes_by_event)),)
+        ) as cursor:
+            async for e in cursor:
+                event = dict(e)
+                for theme_id in themes_by_event[e['id']]:
+                    events_by_theme[theme_id].append(event)
+    
+    # Enrich each trend with its signals and events
+    now = datetime.now()
     trends = []
     for trend in trends_raw:
-        # Parse JSON fields
-        for field in ['related_event_ids', 'related_signal_ids', 'related_indicators']:
-            if trend.get(field):
-                try:
-                    trend[field] = json.loads(trend[field])
-                except:
-                    pass
-        
-        # Get active signals for this trend (exclude expired)
-        # Signals past expires_at are automatically transitioned by recompute_trend_stats
-        cursor = conn.execute(
-            """SELECT * FROM signals 
-               WHERE theme_id = ? AND status = 'active'
-               ORDER BY 
-                   expires_at ASC,
-                   CASE confidence WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
-                   created_at DESC""",
-            (trend['id'],)
-        )
-        trend['signals'] = [dict(s) for s in cursor.fetchall()]
+        trend['signals'] = signals_by_theme.get(trend['id'], [])
+        trend['events'] = events_by_theme.get(trend['id'], [])
         
-        # Get related events (limited)
-        if trend.get('related_event_ids'):
-            event_ids = trend['related_event_ids'][:5]  # Limit to 5
-            placeholders = ','.join(['?' for _ in event_ids])
-            cursor = conn.execute(
-                f"""SELECT id, title, source, published_at, current_score 
-                    FROM events 
-                    WHERE id IN ({placeholders})
-                    ORDER BY published_at DESC""",
-                event_ids
-            )
-            trend['events'] = [dict(e) for e in cursor.fetchall()]
-        else:
-            trend['events'] = []
-        
-        # Compute priority_score and category for each trend
-        trend['priority_score'] = _compute_priority_score(trend)
-        trend['category'] = _classify_category(trend.get('name_vi') or trend.get('name') or '')
+        # Scored/classified by the pipeline; computed here only until the next run
+        if trend.get('priority_score') is None:
+            trend['priority_score'] = compute_priority_score(trend, now)
+        if trend.get('category') is None:
+            trend['category'] = classify_category(trend.get('name_vi') or trend.get('name') or '')
         
         trends.append(trend)
     
-    # Sort by priority_score DESC (highest priority first)
-    trends.sort(key=lambda t: t['priority_score'], reverse=True)
-    
     # has_more: true if there could be more results beyond this page
     has_more = len(trends_raw) == limit
     
@@ -796,40 +855,8 @@ async def list_trends(
     if with_summary:
         # Count only themes with active signals (urgency IS NOT NULL)
         # to match what the dashboard displays
-        cursor = conn.execute(
-            """SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN urgency = 'urgent' THEN 1 ELSE 0 END) as urgent_count,
-                SUM(CASE WHEN urgency = 'watching' THEN 1 ELSE 0 END) as watching_count,
-                SUM(CASE WHEN signals_count > 0 THEN 1 ELSE 0 END) as with_signals_count
-               FROM themes
-               WHERE status IN ('active', 'emerging')
-               AND urgency IS NOT NULL"""
-        )
-        counts = dict(cursor.fetchone())
-        
-        # Get overall signal accuracy
-        cursor = conn.execute(
-            """SELECT 
-                SUM(CASE WHEN status = 'verified_correct' THEN 1 ELSE 0 END) as correct,
-                COUNT(*) as total
-               FROM signals
-               WHERE status IN ('verified_correct', 'verified_wrong')"""
-        )
-        acc = dict(cursor.fetchone())
-        
-        accuracy_pct = None
-        if acc['total'] and acc['total'] > 0:
-            accuracy_pct = round((acc['correct'] or 0) / acc['total'] * 100, 1)
-        
-        result['summary'] = {
-            **counts,
-            'signals_correct': acc['correct'] or 0,
-            'signals_total_verified': acc['total'] or 0,
-            'signals_accuracy': accuracy_pct,
-        }
+        result['summary'] = await _fetch_trends_summary(db, signals_only=True)
     
-    conn.close()
     return result
 
 
@@ -839,7 +866,8 @@ async def list_trends(
 # /trends/urgent/sidebar must be BEFORE /trends/{trend_id}
 # ============================================================
 
-@router.get("/trends/urgent/sidebar")
+@router.get("/trends/urgent/sidebar", dependencies=[Depends(http_revalidate)])
+@ttl_cache(seconds=30)
 async def get_urgent_trends_sidebar():
     """
     Get urgent trends for sidebar quick view.
@@ -852,33 +880,32 @@ async def get_urgent_trends_sidebar():
     - urgent: Array of urgent trends (max 3)
     - watching: Array of watching trends (max 2)
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    # Get urgent
-    cursor = conn.execute(
-        """SELECT id, name, name_vi, urgency, signals_count, earliest_signal_expires
-           FROM themes
-           WHERE urgency = 'urgent' AND status IN ('active', 'emerging')
-           ORDER BY earliest_signal_expires ASC
-           LIMIT 3"""
-    )
-    urgent = [dict(row) for row in cursor.fetchall()]
-    
-    # Get watching
-    cursor = conn.execute(
-        """SELECT id, name, name_vi, urgency, signals_count, earliest_signal_expires
-           FROM themes
-           WHERE urgency = 'watching' AND status IN ('active', 'emerging')
-           ORDER BY earliest_signal_expires ASC
-           LIMIT 2"""
-    )
-    watching = [dict(row) for row in cursor.fetchall()]
+    async with get_pool().acquire() as db:
+        # Get urgent
+        async with db.execute(
+            """SELECT id, name, name_vi, urgency, signals_count, earliest_signal_expires
+               FROM themes
+               WHERE urgency = 'urgent' AND status IN ('active', 'emerging')
+               ORDER BY earliest_signal_expires ASC
+               LIMIT 3"""
+        ) as cursor:
+            urgent = [dict(row) for row in await cursor.fetchall()]
+        
+        # Get watching
+        async with db.execute(
+            """SELECT id, name, name_vi, urgency, signals_count, earliest_signal_expires
+               FROM themes
+               WHERE urgency = 'watching' AND status IN ('active', 'emerging')
+               ORDER BY earliest_signal_expires ASC
+               LIMIT 2"""
+        ) as cursor:
+            watching = [dict(row) for row in await cursor.fetchall()]
     
-    conn.close()
     return {"urgent": urgent, "watching": watching}
 
 
-@router.get("/trends/summary")
+@router.get("/trends/summary", dependencies=[Depends(http_revalidate)])
+@ttl_cache(seconds=30)
 async def get_trends_summary():
     """
     Get summary stats for trends dashboard header.
@@ -886,46 +913,58 @@ async def get_trends_summary():
     ## UI Usage:
     - TrendsPanel header stats bar
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
-        """SELECT 
-            COUNT(*) as total,
-            SUM(CASE WHEN urgency = 'urgent' THEN 1 ELSE 0 END) as urgent_count,
-            SUM(CASE WHEN urgency = 'watching' THEN 1 ELSE 0 END) as watching_count,
-            SUM(CASE WHEN signals_count > 0 THEN 1 ELSE 0 END) as with_signals_count
-           FROM themes
-           WHERE status IN ('active', 'emerging')"""
-    )
-    counts = dict(cursor.fetchone())
-    
-    cursor = conn.execute(
-        """SELECT 
-            SUM(CASE WHEN status = 'verified_correct' THEN 1 ELSE 0 END) as correct,
-            COUNT(*) as total
-           FROM signals
-           WHERE status IN ('verified_correct', 'verified_wrong')"""
-    )
-    acc = dict(cursor.fetchone())
-    
-    accuracy_pct = None
-    if acc['total'] and acc['total'] > 0:
-        accuracy_pct = round((acc['correct'] or 0) / acc['total'] * 100, 1)
-    
-    conn.close()
-    return {
-        **counts,
-        'signals_correct': acc['correct'] or 0,
-        'signals_total_verified': acc['total'] or 0,
-        'signals_accuracy': accuracy_pct,
-    }
+    return await _with_pooled_connection(_fetch_trends_summary)
 
 
 # ============================================================
 # Dynamic route - MUST come AFTER all static /trends/* routes
 # ============================================================
 
-@router.get("/trends/{trend_id}")
+# Related rows for a trend, read through its JSON id columns in SQL
+# (malformed JSON is treated as no related rows)
+SQL_TREND_EVENTS = """SELECT * FROM events 
+    WHERE id IN (SELECT value FROM json_each(
+        (SELECT related_event_ids FROM themes WHERE id = ? AND json_valid(related_event_ids))
+    ))
+    ORDER BY published_at DESC"""
+SQL_TREND_INDICATORS = """SELECT id, name, name_vi, value, change, change_pct, trend, updated_at
+    FROM indicators
+    WHERE id IN (SELECT value FROM json_each(
+        (SELECT related_indicators FROM themes WHERE id = ? AND json_valid(related_indicators))
+    ))"""
+
+
+async def _fetch_trend_rows(db: aiosqlite.Connection, query: str, trend_id: str) -> list:
+    """Rows for a trend-scoped query (SQL_TREND_EVENTS, SQL_TREND_INDICATORS)."""
+    async with db.execute(query, (trend_id,)) as cursor:
+        return await _fetch_dicts(cursor)
+
+
+async def _fetch_trend_signals(db: aiosqlite.Connection, trend_id: str) -> tuple[list, list, list]:
+    """ALL signals for a trend (including verified), plus the active/verified split for UI."""
+    signals, active_signals, verified_signals = [], [], []
+    async with db.execute(
+        """SELECT s.*, e.title as source_event_title
+           FROM signals s
+           LEFT JOIN events e ON s.source_event_id = e.id
+           WHERE s.theme_id = ?
+           ORDER BY 
+               CASE s.status WHEN 'active' THEN 1 ELSE 2 END,
+               s.expires_at ASC""",
+        (trend_id,)
+    ) as cursor:
+        async for row in cursor:
+            signal = dict(row)
+            signals.append(signal)
+            status = signal['status']
+            if status == 'active':
+                active_signals.append(signal)
+            elif status in ('verified_correct', 'verified_wrong'):
+                verified_signals.append(signal)
+    return signals, active_signals, verified_signals
+
+
+@router.get("/trends/{trend_id}", dependencies=[Depends(http_revalidate)])
 async def get_trend(trend_id: str):
     """
     Get single trend with full details.
@@ -937,79 +976,78 @@ async def get_trend(trend_id: str):
     ## Returns:
     - Full theme object with all signals and events
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
-        "SELECT * FROM themes WHERE id = ?",
-        (trend_id,)
+    async def fetch_theme(db: aiosqlite.Connection):
+        async with db.execute(
+            "SELECT * FROM themes WHERE id = ?",
+            (trend_id,)
+        ) as cursor:
+            return await cursor.fetchone()
+    
+    # Signals, events and indicators only need the trend id (the related
+    # id lists are read in SQL), so all four queries run concurrently.
+    # Each takes its own pooled connection and the handler holds none
+    # (holding one while waiting for more can exhaust the pool).
+    theme, (signals, active_signals, verified_signals), events, indicators = await asyncio.gather(
+        _with_pooled_connection(fetch_theme),
+        _with_pooled_connection(lambda conn: _fetch_trend_signals(conn, trend_id)),
+        _with_pooled_connection(lambda conn: _fetch_trend_rows(conn, SQL_TREND_EVENTS, trend_id)),
+        _with_pooled_connection(lambda conn: _fetch_trend_rows(conn, SQL_TREND_INDICATORS, trend_id)),
     )
-    theme = cursor.fetchone()
     
     if not theme:
-        conn.close()
         raise HTTPException(status_code=404, detail="Trend not found")
     
     result = dict(theme)
     
     # Parse JSON fields
     for field in ['related_event_ids', 'related_signal_ids', 'related_indicators']:
-        if result.get(field):
-            try:
-                result[field] = json.loads(result[field])
-            except:
-                pass
-    
-    # Get ALL signals (including verified)
-    cursor = conn.execute(
-        """SELECT s.*, e.title as source_event_title
-           FROM signals s
-           LEFT JOIN events e ON s.source_event_id = e.id
-           WHERE s.theme_id = ?
-           ORDER BY 
-               CASE s.status WHEN 'active' THEN 1 ELSE 2 END,
-               s.expires_at ASC""",
-        (trend_id,)
-    )
-    result['signals'] = [dict(s) for s in cursor.fetchall()]
-    
-    # Separate active and verified signals for UI
-    result['active_signals'] = [s for s in result['signals'] if s['status'] == 'active']
-    result['verified_signals'] = [s for s in result['signals'] if s['status'] in ['verified_correct', 'verified_wrong']]
-    
-    # Get ALL related events
-    if result.get('related_event_ids'):
-        event_ids = result['related_event_ids']
-        placeholders = ','.join(['?' for _ in event_ids])
-        cursor = conn.execute(
-            f"""SELECT * FROM events 
-                WHERE id IN ({placeholders})
-                ORDER BY published_at DESC""",
-            event_ids
-        )
-        result['events'] = [dict(e) for e in cursor.fetchall()]
-    else:
-        result['events'] = []
-    
-    # Get related indicator values
-    if result.get('related_indicators'):
-        ind_ids = result['related_indicators']
-        placeholders = ','.join(['?' for _ in ind_ids])
-        cursor = conn.execute(
-            f"""SELECT id, name, name_vi, value, change, change_pct, trend, updated_at
-                FROM indicators
-                WHERE id IN ({placeholders})""",
-            ind_ids
-        )
-        result['indicators'] = [dict(i) for i in cursor.fetchall()]
-    else:
-        result['indicators'] = []
+        result[field] = _maybe_json(result[field])
+    
+    result['signals'] = signals
+    result['active_signals'] = active_signals
+    result['verified_signals'] = verified_signals
+    result['events'] = events
+    result['indicators'] = indicators
     
-    conn.close()
     return result
 
 
+async def _archive_trends(db: aiosqlite.Connection, trend_ids: list[str]) -> int:
+    """Archive trends in the current transaction, returning how many matched."""
+    cursor = await db.executemany(
+        "UPDATE themes SET status = 'archived', updated_at = datetime('now') WHERE id = ?",
+        [(trend_id,) for trend_id in trend_ids]
+    )
+    return cursor.rowcount
+
+
+@router.post("/trends/archive")
+async def archive_trends(
+    trend_ids: list[str] = Body(..., description="IDs of the trends to archive"),
+    db: aiosqlite.Connection = Depends(get_write_db)
+):
+    """
+    Archive several trends in one transaction.
+    
+    ## UI Usage:
+    - Bulk archive (one commit instead of one request per trend)
+    
+    ## Returns:
+    - archived: Number of trends found and archived (unknown IDs are skipped)
+    """
+    trend_ids = list(dict.fromkeys(trend_ids))
+    if not trend_ids:
+        return {"success": True, "archived": 0}
+    
+    archived = await _archive_trends(db, trend_ids)
+    await db.commit()
+    if archived:
+        invalidate_cache()
+    return {"success": True, "archived": archived}
+
+
 @router.post("/trends/{trend_id}/archive")
-async def archive_trend(trend_id: str):
+async def archive_trend(trend_id: str, db: aiosqlite.Connection = Depends(get_write_db)):
     """
     Archive a trend (set status to 'archived').
     
@@ -1017,24 +1055,18 @@ async def archive_trend(trend_id: str):
     - TrendDetail "Archive" button
     - Removes from active dashboard but keeps history
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
-        "UPDATE themes SET status = 'archived', updated_at = datetime('now') WHERE id = ?",
-        (trend_id,)
-    )
-    
-    if cursor.rowcount == 0:
-        conn.close()
+    if await _archive_trends(db, [trend_id]) == 0:
+        # End the implicit transaction so the write lock isn't held
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Trend not found")
     
-    conn.commit()
-    conn.close()
+    await db.commit()
+    invalidate_cache()
     return {"success": True, "message": f"Trend {trend_id} archived"}
 
 
 @router.post("/trends/{trend_id}/dismiss")
-async def dismiss_trend(trend_id: str):
+async def dismiss_trend(trend_id: str, db: aiosqlite.Connection = Depends(get_write_db)):
     """
     Dismiss a trend (set status to 'fading').
     
@@ -1042,19 +1074,18 @@ async def dismiss_trend(trend_id: str):
     - TrendDetail "Dismiss" button
     - Moves to fading section, will auto-archive eventually
     """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
+    cursor = await db.execute(
         "UPDATE themes SET status = 'fading', urgency = NULL, updated_at = datetime('now') WHERE id = ?",
         (trend_id,)
     )
     
     if cursor.rowcount == 0:
-        conn.close()
+        # End the implicit transaction so the write lock isn't held
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Trend not found")
     
-    conn.commit()
-    conn.close()
+    await db.commit()
+    invalidate_cache()
     return {"success": True, "message": f"Trend {trend_id} dismissed"}
 
 
@@ -1063,148 +1094,130 @@ async def dismiss_trend(trend_id: str):
 # ============================================================
 @router.get("/watchlist")
 async def list_watchlist(
-    status: Optional[str] = Query(default=None, description="active, triggered, dismissed")
+    status: Optional[str] = Query(default=None, description="active, triggered, dismissed"),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List watchlist items, defaults to active."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
     if status == "all":
-        cursor = conn.execute(
-            """SELECT * FROM watchlist 
-               ORDER BY created_at DESC"""
-        )
+        query = """SELECT * FROM watchlist 
+                   ORDER BY created_at DESC"""
+        params = ()
     elif status:
-        cursor = conn.execute(
-            """SELECT * FROM watchlist 
-               WHERE status = ?
-               ORDER BY created_at DESC""",
-            (status,)
-        )
+        query = """SELECT * FROM watchlist 
+                   WHERE status = ?
+                   ORDER BY created_at DESC"""
+        params = (status,)
     else:
         # Default: active
-        cursor = conn.execute(
-            """SELECT * FROM watchlist 
-               WHERE status = 'active'
-               ORDER BY created_at DESC"""
-        )
+        query = """SELECT * FROM watchlist 
+                   WHERE status = 'active'
+                   ORDER BY created_at DESC"""
+        params = ()
     
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"watchlist": [dict(row) for row in rows]}
+    return {"watchlist": rows}
 
 
 @router.get("/watchlist/{item_id}")
-async def get_watchlist_item(item_id: str):
+async def get_watchlist_item(item_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single watchlist item with trigger event."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    cursor = conn.execute(
+    async with db.execute(
         "SELECT * FROM watchlist WHERE id = ?",
         (item_id,)
-    )
-    item = cursor.fetchone()
+    ) as cursor:
+        item = await cursor.fetchone()
     
     if not item:
-        conn.close()
         raise HTTPException(status_code=404, detail="Watchlist item not found")
     
     result = dict(item)
     
     # Get trigger event if exists
     if item["triggered_by_event_id"]:
-        cursor = conn.execute(
+        async with db.execute(
             "SELECT * FROM events WHERE id = ?",
             (item["triggered_by_event_id"],)
-        )
-        event = cursor.fetchone()
+        ) as cursor:
+            event = await cursor.fetchone()
         if event:
             result["trigger_event"] = dict(event)
     
-    conn.close()
     return result
 
 
 # ============================================================
 # Topics
 # ============================================================
-@router.get("/topics/hot")
+@router.get("/topics/hot", dependencies=[Depends(http_cache)])
+@ttl_cache(seconds=30)
 async def get_hot_topics():
     """Get hot topics (3+ occurrences in 7 days)."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        """SELECT * FROM topic_frequency 
-           WHERE is_hot = TRUE 
-           AND last_seen >= date('now', '-7 days')
-           ORDER BY occurrence_count DESC"""
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    async with get_pool().acquire() as db:
+        async with db.execute(
+            """SELECT * FROM topic_frequency 
+               WHERE is_hot = TRUE 
+               AND last_seen >= date('now', '-7 days')
+               ORDER BY occurrence_count DESC"""
+        ) as cursor:
+            rows = await cursor.fetchall()
     
     topics = []
     for row in rows:
         topic = dict(row)
-        if topic.get('related_event_ids'):
-            try:
-                topic['related_event_ids'] = json.loads(topic['related_event_ids'])
-            except:
-                pass
+        topic['related_event_ids'] = _maybe_json(topic['related_event_ids'])
         topics.append(topic)
     
     return {"hot_topics": topics}
 
 
-@router.get("/topics/trending")
+@router.get("/topics/trending", dependencies=[Depends(http_cache)])
+@ttl_cache(seconds=30)
 async def get_trending_topics(limit: int = Query(default=20, le=50)):
     """Get trending topics (appearing frequently)."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        """SELECT * FROM topic_frequency 
-           WHERE occurrence_count >= 2 
-           ORDER BY occurrence_count DESC, last_seen DESC 
-           LIMIT ?""",
-        (limit,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    async with get_pool().acquire() as db:
+        async with db.execute(
+            """SELECT * FROM topic_frequency 
+               WHERE occurrence_count >= 2 
+               ORDER BY occurrence_count DESC, last_seen DESC 
+               LIMIT ?""",
+            (limit,)
+        ) as cursor:
+            rows = await _fetch_dicts(cursor)
     
-    return {"topics": [dict(row) for row in rows]}
+    return {"topics": rows}
 
 
 @router.get("/topics/{topic}/events")
-async def get_topic_events(topic: str):
+async def get_topic_events(topic: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get events related to a topic."""
-    conn = get_connection(settings.DATABASE_PATH)
-    
     # Get topic info
-    cursor = conn.execute(
+    async with db.execute(
         "SELECT * FROM topic_frequency WHERE topic = ?",
         (topic,)
-    )
-    topic_info = cursor.fetchone()
+    ) as cursor:
+        topic_info = await cursor.fetchone()
     
     if not topic_info:
-        conn.close()
         raise HTTPException(status_code=404, detail="Topic not found")
     
     topic_dict = dict(topic_info)
-    event_ids = []
-    if topic_dict.get('related_event_ids'):
-        try:
-            event_ids = json.loads(topic_dict['related_event_ids'])
-        except:
-            pass
+    related = _maybe_json(topic_dict.get('related_event_ids'))
+    event_ids = related if isinstance(related, list) else []
     
     events = []
     if event_ids:
-        placeholders = ','.join(['?' for _ in event_ids])
-        cursor = conn.execute(
-            f"SELECT * FROM events WHERE id IN ({placeholders}) ORDER BY published_at DESC",
-            event_ids
-        )
-        events = [dict(r) for r in cursor.fetchall()]
+        # One statement text for any list length (cached by SQLite, no
+        # 999-parameter limit on large topic clusters)
+        async with db.execute(
+            """SELECT * FROM events
+               WHERE id IN (SELECT value FROM json_each(?))
+               ORDER BY published_at DESC""",
+            (json.dumps(event_ids),)
+        ) as cursor:
+            events = await _fetch_dicts(cursor)
     
-    conn.close()
     
     return {
         "topic": topic_dict,
@@ -1219,13 +1232,12 @@ async def get_topic_events(topic: str):
 async def list_calendar_events(
     country: Optional[str] = None,
     importance: Optional[str] = None,
-    limit: int = Query(default=50, le=200)
+    limit: int = Query(default=50, le=200),
+    db: aiosqlite.Connection = Depends(get_db)
 ):
     """List upcoming economic calendar events."""
     today = date.today().isoformat()
     
-    conn = get_connection(settings.DATABASE_PATH)
-    
     query = "SELECT * FROM calendar_events WHERE date >= ?"
     params = [today]
     
@@ -1239,14 +1251,14 @@ async def list_calendar_events(
     query += " ORDER BY date, time LIMIT ?"
     params.append(limit)
     
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"calendar_events": [dict(row) for row in rows]}
+    return {"calendar_events": rows}
 
 
-@router.get("/calendar/week")
+@router.get("/calendar/week", dependencies=[Depends(http_cache)])
+@ttl_cache(seconds=30)
 async def get_week_calendar():
     """Get this week's calendar events."""
     from datetime import timedelta
@@ -1254,20 +1266,19 @@ async def get_week_calendar():
     today = date.today()
     week_end = today + timedelta(days=7)
     
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        """SELECT * FROM calendar_events 
-           WHERE date >= ? AND date <= ? 
-           ORDER BY date, time""",
-        (today.isoformat(), week_end.isoformat())
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    async with get_pool().acquire() as db:
+        async with db.execute(
+            """SELECT * FROM calendar_events 
+               WHERE date >= ? AND date <= ? 
+               ORDER BY date, time""",
+            (today.isoformat(), week_end.isoformat())
+        ) as cursor:
+            rows = await _fetch_dicts(cursor)
     
     return {
-        "calendar_events": [dict(row) for row in rows],
-        "from": today.isoformat(),
-        "to": week_end.isoformat()
+        "calendar_events": rows,
+        "from": today,
+        "to": week_end
     }
 
 
@@ -1275,28 +1286,26 @@ async def get_week_calendar():
 # Run History
 # ============================================================
 @router.get("/runs")
-async def list_runs(limit: int = Query(default=20, le=100)):
+async def list_runs(limit: int = Query(default=20, le=100), db: aiosqlite.Connection = Depends(get_db)):
     """List processing runs."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
+    async with db.execute(
         "SELECT * FROM run_history ORDER BY run_time DESC LIMIT ?",
         (limit,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    ) as cursor:
+        rows = await _fetch_dicts(cursor)
     
-    return {"runs": [dict(row) for row in rows]}
+    return {"runs": rows}
 
 
-@router.get("/runs/latest")
+@router.get("/runs/latest", dependencies=[Depends(http_cache)])
+@ttl_cache(seconds=30)
 async def get_latest_run():
     """Get the latest processing run."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute(
-        "SELECT * FROM run_history ORDER BY run_time DESC LIMIT 1"
-    )
-    row = cursor.fetchone()
-    conn.close()
+    async with get_pool().acquire() as db:
+        async with db.execute(
+            "SELECT * FROM run_history ORDER BY run_time DESC LIMIT 1"
+        ) as cursor:
+            row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(status_code=404, detail="No runs found")
@@ -1304,13 +1313,21 @@ async def get_latest_run():
     return dict(row)
 
 
+@router.get("/runs/task/{task_id}")
+async def get_refresh_task(task_id: str):
+    """Get status of a pipeline started via /refresh."""
+    job = get_job(task_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return job
+
+
 @router.get("/runs/{run_id}")
-async def get_run(run_id: str):
+async def get_run(run_id: str, db: aiosqlite.Connection = Depends(get_db)):
     """Get single run details."""
-    conn = get_connection(settings.DATABASE_PATH)
-    cursor = conn.execute("SELECT * FROM run_history WHERE id = ?", (run_id,))
-    row = cursor.fetchone()
-    conn.close()
+    async with db.execute("SELECT * FROM run_history WHERE id = ?", (run_id,)) as cursor:
+        row = await cursor.fetchone()
     
     if not row:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -1322,34 +1339,20 @@ async def get_run(run_id: str):
 # Refresh (Manual trigger)
 # ============================================================
 @router.post("/refresh")
-async def trigger_refresh(background_tasks: BackgroundTasks):
-    """Manually trigger data refresh and analysis."""
-    from processor.pipeline import Pipeline
-    from database.session import close_engine
-    import asyncio
-    
-    def run_pipeline():
-        async def _run():
-            # Close any existing engine from previous runs to avoid reusing
-            # an engine bound to a different event loop
-            await close_engine()
-            pipeline = Pipeline()
-            return await pipeline.run()
-        
-        try:
-            result = asyncio.run(_run())
-            return result
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Pipeline error: {e}", exc_info=True)
-            return {"error": str(e)}
+async def trigger_refresh():
+    """
+    Manually trigger data refresh and analysis.
     
-    background_tasks.add_task(run_pipeline)
+    The pipeline runs in a separate process (see api/jobs.py); poll
+    /runs/task/{task_id} or /runs/latest for the outcome.
+    """
+    task_id = await start_pipeline_job(on_exit=invalidate_cache)
     
     return {
         "status": "triggered",
+        "task_id": task_id,
         "message": "Pipeline started in background. Check /api/runs/latest for status.",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     }
 
 
@@ -1361,6 +1364,7 @@ async def trigger_ranking_refresh():
     try:
         pipeline = Pipeline()
         result = await pipeline.run_ranking_only()
+        invalidate_cache()
         return {
             "status": "success",
             "result": result
@@ -1372,83 +1376,128 @@ async def trigger_ranking_refresh():
 # ============================================================
 # Dashboard Summary
 # ============================================================
-@router.get("/dashboard")
-async def get_dashboard_summary():
-    """
-    Get complete dashboard data in one call.
-    
-    Optimized for frontend to minimize API calls.
-    """
-    conn = get_connection(settings.DATABASE_PATH)
-    
-    result = {
-        "timestamp": datetime.now().isoformat(),
-        "key_events": [],
-        "other_news_count": 0,
-        "indicators": {},
-        "investigations": {
-            "high_priority": [],
-            "medium_priority": []
-        },
-        "hot_topics": [],
-        "last_run": None
-    }
-    
-    # Key events (top 15)
-    cursor = conn.execute(
-        """SELECT * FROM events 
-           WHERE display_section = 'key_events' 
-           ORDER BY current_score DESC LIMIT 15"""
-    )
-    result["key_events"] = [dict(r) for r in cursor.fetchall()]
-    
-    # Other news count
-    cursor = conn.execute(
+# INDICATOR_GROUPS is fixed, so the IN list is built once at import
+SQL_DASHBOARD_INDICATORS = (
+    f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators WHERE category IN ("
+    + ','.join('?' for _ in INDICATOR_GROUPS)
+    + ") ORDER BY category, name"
+)
+DASHBOARD_INDICATOR_GROUP_IDS = tuple(INDICATOR_GROUPS)
+
+
+async def _fetch_key_events(db: aiosqlite.Connection) -> list:
+    """Key events (top 15)."""
+    async with db.execute(SQL_KEY_EVENTS) as cursor:
+        return await _fetch_dicts(cursor)
+
+
+async def _fetch_other_news_count(db: aiosqlite.Connection) -> int:
+    """Other news count, maintained by the pipeline in kv_cache."""
+    async with db.execute(
+        "SELECT value FROM kv_cache WHERE key = ?",
+        (OTHER_NEWS_COUNT_KEY,)
+    ) as cursor:
+        row = await cursor.fetchone()
+    if row and row['value'] is not None:
+        return int(row['value'])
+    
+    # Pipeline hasn't stored it yet
+    async with db.execute(
         "SELECT COUNT(*) as count FROM events WHERE display_section = 'other_news'"
-    )
-    row = cursor.fetchone()
-    result["other_news_count"] = row['count'] if row else 0
-    
-    # Key indicators by group
+    ) as cursor:
+        row = await cursor.fetchone()
+    return row['count'] if row else 0
+
+
+async def _fetch_indicator_groups(db: aiosqlite.Connection) -> dict:
+    """Key indicators by group (one query for all groups)."""
+    async with db.execute(
+        SQL_DASHBOARD_INDICATORS, DASHBOARD_INDICATOR_GROUP_IDS
+    ) as cursor:
+        rows = await cursor.fetchall()
+    indicators_by_group = defaultdict(list)
+    for r in rows:
+        indicators_by_group[r['category']].append(dict(r))
+    
+    groups = {}
     for group_id, group_info in INDICATOR_GROUPS.items():
-        cursor = conn.execute(
-            "SELECT * FROM indicators WHERE category = ? ORDER BY name",
-            (group_id,)
-        )
-        indicators = [dict(r) for r in cursor.fetchall()]
+        indicators = indicators_by_group.get(group_id)
         if indicators:
-            result["indicators"][group_id] = {
+            groups[group_id] = {
                 "display_name": group_info["display_name"],
                 "items": indicators
             }
-    
-    # Open investigations
-    cursor = conn.execute(
+    return groups
+
+
+async def _fetch_open_investigations(db: aiosqlite.Connection) -> dict:
+    """Open investigations, split into high and other priority in one pass."""
+    investigations = {"high_priority": [], "medium_priority": []}
+    async with db.execute(
         """SELECT i.*, e.title as source_event_title
            FROM investigations i
            LEFT JOIN events e ON i.source_event_id = e.id
            WHERE i.status IN ('open', 'updated')
            ORDER BY CASE i.priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END"""
-    )
-    investigations = [dict(r) for r in cursor.fetchall()]
-    result["investigations"]["high_priority"] = [i for i in investigations if i.get('priority') == 'high']
-    result["investigations"]["medium_priority"] = [i for i in investigations if i.get('priority') != 'high']
-    
-    # Hot topics
-    cursor = conn.execute(
+    ) as cursor:
+        async for r in cursor:
+            bucket = "high_priority" if r['priority'] == 'high' else "medium_priority"
+            investigations[bucket].append(dict(r))
+    return investigations
+
+
+async def _fetch_hot_topics(db: aiosqlite.Connection) -> list:
+    """Hot topics."""
+    async with db.execute(
         """SELECT * FROM topic_frequency 
            WHERE is_hot = TRUE 
            ORDER BY occurrence_count DESC LIMIT 10"""
-    )
-    result["hot_topics"] = [dict(r) for r in cursor.fetchall()]
-    
-    # Last run
-    cursor = conn.execute(
+    ) as cursor:
+        return await _fetch_dicts(cursor)
+
+
+async def _fetch_last_run(db: aiosqlite.Connection) -> Optional[dict]:
+    """Last run."""
+    async with db.execute(
         "SELECT * FROM run_history ORDER BY run_time DESC LIMIT 1"
-    )
-    last_run = cursor.fetchone()
-    if last_run:
-        result["last_run"] = dict(last_run)
+    ) as cursor:
+        last_run = await cursor.fetchone()
+    return dict(last_run) if last_run else None
+
+
+@router.get("/dashboard", dependencies=[Depends(http_cache)])
+@ttl_cache(seconds=30)
+async def get_dashboard_summary():
+    """
+    Get complete dashboard data in one call.
     
-    conn.close()
-    return result
+    Optimized for frontend to minimize API calls. The independent
+    sections are fetched concurrently, each on its own pooled connection.
+    """
+    (
+        key_events,
+        other_news_count,
+        indicators,
+        investigations,
+        hot_topics,
+        last_run,
+    ) = await asyncio.gather(*(
+        _with_pooled_connection(fetch) for fetch in (
+            _fetch_key_events,
+            _fetch_other_news_count,
+            _fetch_indicator_groups,
+            _fetch_open_investigations,
+            _fetch_hot_topics,
+            _fetch_last_run,
+        )
+    ))
+    
+    return {
+        "timestamp": datetime.now(),
+        "key_events": key_events,
+        "other_news_count": other_news_count,
+        "indicators": indicators,
+        "investigations": investigations,
+        "hot_topics": hot_topics,
+        "last_run": last_run
+    }
@@ -9,6 +9,7 @@ from pathlib import Path
 import json
 import hashlib
 
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from loguru import logger
 
 if TYPE_CHECKING:
@@ -80,6 +81,21 @@ class IndicatorData:
         return asdict(self)
 
 
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse HTML with lxml (C parser, much faster than the pure-Python
+    html.parser on full pages), falling back to html.parser if lxml
+    isn't installed.
+    
+    Args:
+        parse_only: Only build the tree for matching elements
+    """
+    try:
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
+
+
 class BaseCrawler(ABC):
     """Abstract base class for all data crawlers."""
     
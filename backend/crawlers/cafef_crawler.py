@@ -14,8 +14,8 @@ Architecture:
 - Fetch each article for full content + publish date
 - Transform to EventRecord for LLM pipeline
 """
+import os
 import re
-import json
 import asyncio
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -23,18 +23,76 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import SoupStrainer
 from loguru import logger
 
-from .base_crawler import BaseCrawler, CrawlResult
+from .base_crawler import BaseCrawler, CrawlResult, make_soup
 from data_transformers.cafef import CafeFTransformer
 
 
+# ============================================================
+# HTML PARSING
+# ============================================================
+
+# AM/PM suffix on article times ("12-02-2026 - 14:19 PM"), already 24h
+AM_PM_PATTERN = re.compile(r'\s*(AM|PM)\s*', re.IGNORECASE)
+
+# Article time formats tried by _parse_article_datetime when the fast
+# paths don't apply (most common first)
+ARTICLE_DATETIME_FORMATS = (
+    "%d-%m-%Y %H:%M",
+    "%d/%m/%Y %H:%M",
+    "%Y-%m-%d %H:%M",
+)
+
+# Category page containers read by _parse_category_page; everything else
+# (menus, sidebars, footer, scripts) is skipped while building the tree
+CATEGORY_ITEM_CLASSES = {"firstitem", "cate-hl-row2", "tlitem"}
+
+
+def _is_category_item(name: str, attrs: Dict[str, Any]) -> bool:
+    """
+    SoupStrainer filter for the category page containers (raw tag attrs).
+    
+    While parsing, class is still the raw attribute string, so it is
+    split here; a class_ list would only match single-class containers.
+    """
+    return name == "div" and not CATEGORY_ITEM_CLASSES.isdisjoint(attrs.get("class", "").split())
+
+
+CATEGORY_ITEMS = SoupStrainer(_is_category_item)
+
+# Article page parts read by _parse_article_page (any h1 is kept for the
+# title fallback); matched elements keep their whole subtree
+ARTICLE_PART_CLASSES = {
+    "p": {"sapo"},
+    "div": {"detail-content", "contentdetail"},
+    "span": {"pdate"},
+}
+
+# Content blocks joined into the article text; "Xem thêm" (read more)
+# link blocks are dropped
+ARTICLE_TEXT_TAGS = ["p", "h2", "h3"]
+READ_MORE_PREFIX = "Xem thêm"
+
+
+def _is_article_part(name: str, attrs: Dict[str, Any]) -> bool:
+    """SoupStrainer filter for the article page parts (raw tag attrs)."""
+    if name == "h1":
+        return True
+    classes = ARTICLE_PART_CLASSES.get(name)
+    return bool(classes) and not classes.isdisjoint(attrs.get("class", "").split())
+
+
+ARTICLE_PARTS = SoupStrainer(_is_article_part)
+
+
 # ============================================================
 # DATA CLASSES
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class CafeFNewsItem:
     """News item extracted from CafeF category page."""
     title: str
@@ -45,7 +103,7 @@ class CafeFNewsItem:
     source: str = "cafef"
 
 
-@dataclass 
+@dataclass(slots=True)
 class CafeFArticleContent:
     """Full article content from CafeF."""
     title: str
@@ -91,6 +149,10 @@ class CafeFCrawler(BaseCrawler):
     
     BASE_URL = "https://cafef.vn"
     
+    # Article pages fetched at once (request starts are still spaced by
+    # _rate_limit, so this only overlaps response times)
+    MAX_CONCURRENT_ARTICLES = 4
+    
     # Category URLs to crawl with their display names
     CATEGORIES = {
         "thi-truong-chung-khoan": "Chứng khoán",
@@ -112,31 +174,65 @@ class CafeFCrawler(BaseCrawler):
         super().__init__(name="cafef", data_dir=data_dir)
         self.source = "cafef"
         self._transformer = CafeFTransformer()
+        
+        # Rate limiting (article pages)
+        self._next_request = 0.0
+        self._min_interval = 0.2  # seconds between requests (5/s)
     
     @property
     def transformer(self):
         """Return the transformer for this crawler."""
         return self._transformer
     
+    async def _rate_limit(self):
+        """
+        Ensure minimum interval between requests.
+        
+        Each caller reserves the next free slot before sleeping, so
+        concurrent article fetches stay evenly spaced instead of all
+        waking up together.
+        """
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_request)
+        self._next_request = slot + self._min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def _new_client(self) -> httpx.AsyncClient:
+        """
+        HTTP client for CafeF requests.
+        
+        One client is shared across a whole crawl so keep-alive
+        connections (and their TLS sessions) are reused between pages.
+        """
+        return httpx.AsyncClient(
+            timeout=30.0,
+            headers=self.HEADERS,
+            verify=False,  # CafeF sometimes has SSL issues
+            follow_redirects=True,
+        )
+    
     def _make_absolute_url(self, href: str) -> str:
         """Convert relative URL to absolute."""
         if not href:
             return ""
-        if href.startswith("http"):
-            return href
-        if href.startswith("//"):
-            return f"https:{href}"
-        if href.startswith("/"):
+        # Root-relative links are the common case, so branch on the first char
+        first = href[0]
+        if first == "/":
+            if href[1:2] == "/":
+                return f"https:{href}"
             return f"{self.BASE_URL}{href}"
+        if first == "h" and href.startswith("http"):
+            return href
         return f"{self.BASE_URL}/{href}"
     
     def _clean_text(self, text: Optional[str]) -> str:
         """Clean text content."""
         if not text:
             return ""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Collapse whitespace runs (str.split() treats the same characters
+        # as whitespace as \s, without going through the regex engine)
+        return ' '.join(text.split())
     
     def _parse_cafef_datetime(self, time_str: str) -> Optional[datetime]:
         """
@@ -151,11 +247,12 @@ class CafeFCrawler(BaseCrawler):
         
         time_str = time_str.strip()
         
-        # Try ISO format first (from time-ago title attribute)
-        try:
-            return datetime.fromisoformat(time_str)
-        except ValueError:
-            pass
+        # ISO format (from time-ago title attribute); display format has '/'
+        if '/' not in time_str:
+            try:
+                return datetime.fromisoformat(time_str)
+            except ValueError:
+                pass
         
         # Try display format: "12/02/2026 - 00:05"
         try:
@@ -167,55 +264,67 @@ class CafeFCrawler(BaseCrawler):
         
         return None
     
-    async def fetch(self, categories: Optional[List[str]] = None) -> CrawlResult:
+    async def fetch(
+        self,
+        categories: Optional[List[str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> CrawlResult:
         """
         Fetch article list from CafeF category pages.
         
         Args:
             categories: List of category slugs to crawl. 
                         Default: all defined categories.
+            client: Shared HTTP client (a new one is opened if not given)
         
         Returns:
             CrawlResult with list of news items (no full content yet)
         """
+        if client is None:
+            async with self._new_client() as client:
+                return await self.fetch(categories=categories, client=client)
+        
         if categories is None:
             categories = list(self.CATEGORIES.keys())
         
-        all_items: List[CafeFNewsItem] = []
-        
-        async with httpx.AsyncClient(
-            timeout=30.0, 
-            headers=self.HEADERS,
-            verify=False,  # CafeF sometimes has SSL issues
-            follow_redirects=True,
-        ) as client:
-            for cat_slug in categories:
-                cat_name = self.CATEGORIES.get(cat_slug, cat_slug)
-                url = f"{self.BASE_URL}/{cat_slug}.chn"
+        async def fetch_category(cat_slug: str) -> List[CafeFNewsItem]:
+            cat_name = self.CATEGORIES.get(cat_slug, cat_slug)
+            url = f"{self.BASE_URL}/{cat_slug}.chn"
+            
+            logger.info(f"[cafef] Fetching {cat_name}: {url}")
+            
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
                 
-                logger.info(f"[cafef] Fetching {cat_name}: {url}")
+                # Parse in a worker thread so other downloads keep
+                # progressing while the tree is built
+                items = await asyncio.to_thread(
+                    self._parse_category_page,
+                    response.text,
+                    category=cat_name,
+                )
+                logger.info(f"[cafef] Found {len(items)} articles in {cat_name}")
+                return items
                 
-                try:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    
-                    items = self._parse_category_page(
-                        response.text, 
-                        category=cat_name
-                    )
-                    all_items.extend(items)
-                    logger.info(f"[cafef] Found {len(items)} articles in {cat_name}")
-                    
-                except Exception as e:
-                    logger.error(f"[cafef] Error fetching {cat_name}: {e}")
-        
-        # Deduplicate by URL
+            except Exception as e:
+                logger.error(f"[cafef] Error fetching {cat_name}: {e}")
+                return []
+        
+        # Category pages are independent, fetch them all at once
+        items_by_category = await asyncio.gather(*(
+            fetch_category(cat_slug) for cat_slug in categories
+        ))
+        
+        # Deduplicated by URL, in category order
         seen_urls = set()
-        unique_items = []
-        for item in all_items:
-            if item.url not in seen_urls:
-                seen_urls.add(item.url)
-                unique_items.append(item)
+        unique_items: List[CafeFNewsItem] = []
+        
+        for items in items_by_category:
+            for item in items:
+                if item.url not in seen_urls:
+                    seen_urls.add(item.url)
+                    unique_items.append(item)
         
         logger.info(f"[cafef] Found {len(unique_items)} unique articles")
         
@@ -248,13 +357,13 @@ class CafeFCrawler(BaseCrawler):
         - Secondary featured (.cate-hl-row2 .big)
         - News list (.tlitem)
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, parse_only=CATEGORY_ITEMS)
         items: List[CafeFNewsItem] = []
         
         # 1. Parse featured item (.firstitem)
         firstitem = soup.find("div", class_="firstitem")
         if firstitem:
-            item = self._parse_firstitem(firstitem, category)
+            item = self._parse_item(firstitem, category, "h2")
             if item:
                 items.append(item)
         
@@ -262,126 +371,67 @@ class CafeFCrawler(BaseCrawler):
         row2 = soup.find("div", class_="cate-hl-row2")
         if row2:
             for big in row2.find_all("div", class_="big"):
-                item = self._parse_big_item(big, category)
+                item = self._parse_item(big, category, "h3")
                 if item:
                     items.append(item)
         
         # 3. Parse news list items (.tlitem)
         for tlitem in soup.find_all("div", class_="tlitem"):
-            item = self._parse_tlitem(tlitem, category)
+            item = self._parse_item(tlitem, category, "h3", list_item=True)
             if item:
                 items.append(item)
         
         return items
     
-    def _parse_firstitem(self, elem, category: str) -> Optional[CafeFNewsItem]:
-        """Parse featured first item."""
-        try:
-            # Title and URL from h2 > a
-            h2 = elem.find("h2")
-            if not h2:
-                return None
-            
-            link = h2.find("a")
-            if not link:
-                return None
-            
-            title = link.get("title", "") or link.get_text(strip=True)
-            href = link.get("href", "")
-            
-            if not title or not href:
-                return None
-            
-            # Summary from .sapo
-            sapo = elem.find("p", class_="sapo")
-            summary = sapo.get_text(strip=True) if sapo else None
-            
-            # Time from .time
-            time_elem = elem.find("p", class_="time")
-            published_at = None
-            if time_elem:
-                time_str = time_elem.get("data-time") or time_elem.get_text(strip=True)
-                published_at = self._parse_cafef_datetime(time_str)
-            
-            return CafeFNewsItem(
-                title=self._clean_text(title),
-                url=self._make_absolute_url(href),
-                category=category,
-                summary=self._clean_text(summary) if summary else None,
-                published_at=published_at,
-            )
-        except Exception:
-            return None
-    
-    def _parse_big_item(self, elem, category: str) -> Optional[CafeFNewsItem]:
-        """Parse secondary featured item (.big)."""
-        try:
-            # Title and URL from h3 > a
-            h3 = elem.find("h3")
-            if not h3:
-                return None
-            
-            link = h3.find("a")
-            if not link:
-                return None
-            
-            title = link.get("title", "") or link.get_text(strip=True)
-            href = link.get("href", "")
-            
-            if not title or not href:
-                return None
-            
-            # Summary from .sapo (usually hidden)
-            sapo = elem.find("p", class_="sapo")
-            summary = sapo.get_text(strip=True) if sapo else None
-            
-            # Time from .time
-            time_elem = elem.find("p", class_="time")
-            published_at = None
-            if time_elem:
-                time_str = time_elem.get("data-time") or time_elem.get_text(strip=True)
-                published_at = self._parse_cafef_datetime(time_str)
-            
-            return CafeFNewsItem(
-                title=self._clean_text(title),
-                url=self._make_absolute_url(href),
-                category=category,
-                summary=self._clean_text(summary) if summary else None,
-                published_at=published_at,
-            )
-        except Exception:
-            return None
-    
-    def _parse_tlitem(self, elem, category: str) -> Optional[CafeFNewsItem]:
-        """Parse news list item (.tlitem)."""
+    def _parse_item(
+        self,
+        elem,
+        category: str,
+        heading: str,
+        list_item: bool = False,
+    ) -> Optional[CafeFNewsItem]:
+        """
+        Parse one category page item.
+        
+        Featured items (.firstitem with h2, .big with h3) take the title
+        from the link's title attribute and the time from p.time. List
+        items (.tlitem, h3) use the link text and prefer the ISO time in
+        span.time-ago's title.
+        
+        Args:
+            heading: Tag holding the title link ("h2" or "h3")
+            list_item: Parse with the .tlitem layout
+        """
         try:
-            # Title and URL from h3 > a
-            h3 = elem.find("h3")
-            if not h3:
+            # Title and URL from heading > a
+            header = elem.find(heading)
+            if not header:
                 return None
             
-            link = h3.find("a")
+            link = header.find("a")
             if not link:
                 return None
             
-            title = link.get_text(strip=True)
+            if list_item:
+                title = link.get_text(strip=True)
+            else:
+                title = link.get("title", "") or link.get_text(strip=True)
             href = link.get("href", "")
             
             if not title or not href:
                 return None
             
-            # Summary from .sapo
+            # Summary from .sapo (usually hidden on .big)
             sapo = elem.find("p", class_="sapo")
             summary = sapo.get_text(strip=True) if sapo else None
             
-            # Time from .time-ago (ISO in title) or .time
+            # Time from .time-ago (ISO in title, list items) or .time
             published_at = None
-            time_elem = elem.find("span", class_="time-ago")
-            if time_elem:
-                time_str = time_elem.get("title", "")
-                published_at = self._parse_cafef_datetime(time_str)
+            time_ago = elem.find("span", class_="time-ago") if list_item else None
+            if time_ago:
+                published_at = self._parse_cafef_datetime(time_ago.get("title", ""))
             else:
-                time_elem = elem.find(class_="time")
+                time_elem = elem.find(class_="time") if list_item else elem.find("p", class_="time")
                 if time_elem:
                     time_str = time_elem.get("data-time") or time_elem.get_text(strip=True)
                     published_at = self._parse_cafef_datetime(time_str)
@@ -396,28 +446,33 @@ class CafeFCrawler(BaseCrawler):
         except Exception:
             return None
     
-    async def fetch_article_content(self, url: str) -> Optional[CafeFArticleContent]:
+    async def fetch_article_content(
+        self,
+        url: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Optional[CafeFArticleContent]:
         """
         Fetch full content from a CafeF article URL.
         
         Args:
             url: Full URL to the article
+            client: Shared HTTP client (a new one is opened if not given)
             
         Returns:
             CafeFArticleContent or None if failed
         """
+        if client is None:
+            async with self._new_client() as client:
+                return await self.fetch_article_content(url, client=client)
+        
         try:
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                headers=self.HEADERS,
-                verify=False,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                return self._parse_article_page(response.text, url)
-                
+            await self._rate_limit()
+            response = await client.get(url)
+            response.raise_for_status()
+            
+            # Parse in a worker thread (see fetch)
+            return await asyncio.to_thread(self._parse_article_page, response.text, url)
+            
         except Exception as e:
             logger.error(f"[cafef] Error fetching article {url}: {e}")
             return None
@@ -433,7 +488,7 @@ class CafeFCrawler(BaseCrawler):
         - Time: span.pdate (format: "12-02-2026 - 14:19 PM")
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, parse_only=ARTICLE_PARTS)
             
             # Title
             title_elem = soup.find("h1", class_="title-detail")
@@ -455,12 +510,14 @@ class CafeFCrawler(BaseCrawler):
             content = ""
             if content_elem:
                 # Get text from paragraphs
-                paragraphs = []
-                for p in content_elem.find_all(["p", "h2", "h3"]):
-                    text = p.get_text(strip=True)
-                    if text and not text.startswith("Xem thêm"):
-                        paragraphs.append(text)
-                content = "\n\n".join(paragraphs)
+                texts = (
+                    elem.get_text(strip=True)
+                    for elem in content_elem.find_all(ARTICLE_TEXT_TAGS)
+                )
+                content = "\n\n".join(
+                    text for text in texts
+                    if text and not text.startswith(READ_MORE_PREFIX)
+                )
             
             # Published time
             published_at = None
@@ -494,20 +551,24 @@ class CafeFCrawler(BaseCrawler):
             return None
         
         # Clean up
-        time_str = time_str.strip()
-        time_str = re.sub(r'\s*(AM|PM)\s*', '', time_str, flags=re.IGNORECASE)
-        time_str = time_str.replace(" - ", " ")
+        time_str = AM_PM_PATTERN.sub('', time_str.strip())
+        time_str = time_str.replace(" - ", " ").strip()
         
-        # Try various formats
-        formats = [
-            "%d-%m-%Y %H:%M",
-            "%d/%m/%Y %H:%M",
-            "%Y-%m-%d %H:%M",
-        ]
+        # Fast paths picked from the separators: "12/02/2026 14:19",
+        # "2026-02-12 14:19"
+        try:
+            if '/' in time_str:
+                return datetime.strptime(time_str, "%d/%m/%Y %H:%M")
+            if time_str[4:5] == '-':
+                return datetime.fromisoformat(time_str)
+        except ValueError:
+            pass
         
-        for fmt in formats:
+        # Day-first dashes ("12-02-2026 14:19", "1-2-2026 14:19") and
+        # anything the fast paths rejected
+        for fmt in ARTICLE_DATETIME_FORMATS:
             try:
-                return datetime.strptime(time_str.strip(), fmt)
+                return datetime.strptime(time_str, fmt)
             except ValueError:
                 continue
         
@@ -519,6 +580,7 @@ class CafeFCrawler(BaseCrawler):
         max_articles: Optional[int] = None,
         save_raw: bool = False,
         existing_titles: Optional[set] = None,
+        existing_urls: Optional[set] = None,
     ) -> CrawlResult:
         """
         Full crawl: fetch article list + content.
@@ -528,55 +590,67 @@ class CafeFCrawler(BaseCrawler):
             max_articles: Limit number of articles to fetch content (None = all)
             save_raw: Save raw data to JSON file for debugging
             existing_titles: Set of titles already in DB (skip fetching content for these)
+            existing_urls: Set of source URLs already in DB (same, checked first)
             
         Returns:
             CrawlResult with articles including content
         """
         logger.info(f"[cafef] Starting full crawl (max_articles={max_articles})...")
         
-        # Step 1: Fetch article list
-        list_result = await self.fetch(categories=categories)
-        
-        if not list_result.success:
-            return list_result
-        
-        articles = list_result.data
-        total_found = len(articles)
-        
-        # Step 2: Filter out articles already in database
-        existing_titles = existing_titles or set()
-        new_articles = []
-        skipped_count = 0
-        
-        for article in articles:
-            title = (article.get("title") or "").strip()
-            if title and title in existing_titles:
-                skipped_count += 1
-                logger.debug(f"[cafef] Skipping duplicate: {title[:50]}...")
-                continue
-            new_articles.append(article)
-        
-        if skipped_count > 0:
-            logger.info(f"[cafef] Skipped {skipped_count} existing articles, {len(new_articles)} new to fetch")
+        # One client for the list and all articles, so connections are reused
+        async with self._new_client() as client:
+            # Step 1: Fetch article list
+            list_result = await self.fetch(categories=categories, client=client)
+            
+            if not list_result.success:
+                return list_result
+            
+            articles = list_result.data
+            total_found = len(articles)
+            
+            # Step 2: Filter out articles already in database
+            # Normalize the DB titles once; list titles are already
+            # whitespace-cleaned by _parse_item, so only need lowercasing
+            known_titles = frozenset(t.strip().lower() for t in existing_titles or ())
+            existing_urls = existing_urls or set()
+            new_articles = []
+            skipped_count = 0
+            
+            for article in articles:
+                title = article.get("title") or ""
+                if article.get("source_url") in existing_urls or (title and title.lower() in known_titles):
+                    skipped_count += 1
+                    logger.debug(f"[cafef] Skipping duplicate: {title[:50]}...")
+                    continue
+                new_articles.append(article)
+            
+            if skipped_count > 0:
+                logger.info(f"[cafef] Skipped {skipped_count} existing articles, {len(new_articles)} new to fetch")
+            
+            # Step 3: Fetch content for new articles only
+            articles_to_fetch = new_articles[:max_articles] if max_articles else new_articles
+            
+            logger.info(f"[cafef] Fetching content for {len(articles_to_fetch)} articles...")
+            
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ARTICLES)
+            
+            async def fetch_bounded(i: int, item: dict) -> Optional[CafeFArticleContent]:
+                async with semaphore:
+                    title_short = item.get("title", "")[:50]
+                    logger.info(f"[cafef] [{i}/{len(articles_to_fetch)}] {title_short}...")
+                    return await self.fetch_article_content(item.get("source_url", ""), client=client)
+            
+            fetched_articles = await asyncio.gather(*(
+                fetch_bounded(i, item) for i, item in enumerate(articles_to_fetch, 1)
+            ))
         
-        # Step 3: Fetch content for new articles only
-        articles_to_fetch = new_articles[:max_articles] if max_articles else new_articles
+        # Merge content into items (in list order)
+        results = []
         fetched_count = 0
         failed_count = 0
         
-        logger.info(f"[cafef] Fetching content for {len(articles_to_fetch)} articles...")
-        
-        results = []
-        
-        for i, item in enumerate(articles_to_fetch, 1):
-            url = item.get("source_url", "")
-            title_short = item.get("title", "")[:50]
-            logger.info(f"[cafef] [{i}/{len(articles_to_fetch)}] {title_short}...")
-            
-            article = await self.fetch_article_content(url)
-            
+        for item, article in zip(articles_to_fetch, fetched_articles):
             if article:
-                # Merge content into item
                 item["content"] = article.content
                 item["summary"] = article.summary or item.get("summary")
                 if article.published_at:
@@ -587,9 +661,6 @@ class CafeFCrawler(BaseCrawler):
                 failed_count += 1
             
             results.append(item)
-            
-            # Small delay to be polite
-            await asyncio.sleep(0.5)
         
         # Add metadata
         metadata = {
@@ -606,19 +677,27 @@ class CafeFCrawler(BaseCrawler):
         
         # Save raw if requested
         if save_raw:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            raw_file = self.data_dir / "raw" / f"cafef_{timestamp}.json"
-            raw_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(raw_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "source": self.source,
-                    "crawled_at": datetime.now().isoformat(),
-                    "success": True,
-                    "data": final_data,
-                    "error": None,
-                    "count": len(final_data),
-                }, f, ensure_ascii=False, indent=2)
+            # raw_dir is created once by BaseCrawler.__init__
+            raw_file = self.raw_dir / f"cafef_{datetime.now():%Y%m%d_%H%M%S}.json"
+            
+            # orjson writes compact UTF-8 bytes directly (no ASCII escaping)
+            payload = orjson.dumps({
+                "source": self.source,
+                "crawled_at": datetime.now().isoformat(),
+                "success": True,
+                "data": final_data,
+                "error": None,
+                "count": len(final_data),
+            })
+            
+            # Write a temp file and rename it over the target, so a crash
+            # mid-write never leaves a truncated JSON file behind
+            tmp_file = raw_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_file.replace(raw_file)
             
             logger.info(f"[cafef] Saved raw data to {raw_file}")
         
@@ -10,15 +10,23 @@ Data sources from https://www.sbv.gov.vn:
 - Văn bản QPPL (Legal documents)
 """
 import asyncio
+import codecs
+import hashlib
+import multiprocessing
+import os
 import re
 import json
 import io
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain
 from typing import Optional, List, Dict, Any
+from urllib.parse import urlsplit
 from dataclasses import dataclass, field
 from bs4 import BeautifulSoup
 
 import httpx
+import orjson
 from loguru import logger
 
 # PDF extraction
@@ -29,11 +37,75 @@ except ImportError:
     PDF_SUPPORT = False
     logger.warning("[SBV] PyMuPDF not installed. PDF text extraction disabled. Install with: pip install pymupdf")
 
-from .base_crawler import BaseCrawler, CrawlResult, IndicatorData
+from .base_crawler import BaseCrawler, CrawlResult, IndicatorData, make_soup
 from data_transformers.sbv import SBVTransformer
 from config import settings
 
 
+# ============================================================
+# HOMEPAGE SCRIPT PATTERNS
+# ============================================================
+
+# Chart data embedded in the homepage JavaScript, read by
+# _extract_exchange_rate, _extract_credit_data and
+# fetch_exchange_rate_history
+EXCHANGE_RATE_VALUES_PATTERN = re.compile(r'var\s+tyGiaValues\s*=\s*\[([\d,\s]+)\]')
+EXCHANGE_RATE_DATES_PATTERN = re.compile(r'var\s+dates\s*=\s*\[(.*?)\]', re.DOTALL)
+CREDIT_VALUES_PATTERN = re.compile(r'var\s+ChartDuNoValues\s*=\s*\[(.*?)\]', re.DOTALL)
+CREDIT_LABELS_PATTERN = re.compile(r'var\s+ChartDuNoLabels\s*=\s*\[(.*?)\]', re.DOTALL)
+QUOTED_STRING_PATTERN = re.compile(r'"([^"]+)"')
+
+
+# ============================================================
+# RATE LIMITS
+# ============================================================
+
+# Seconds between request starts per host (www. stripped); hosts not
+# listed use SBVCrawler._min_interval. SJC is a separate server, so the
+# gold price request doesn't wait behind sbv.gov.vn pages.
+HOST_MIN_INTERVALS = {
+    "sjc.com.vn": 0.5,
+}
+
+# PDF attachments of one article downloaded at once (large Thong tu
+# PDFs can take minutes each on sbv.gov.vn)
+MAX_CONCURRENT_PDFS = 2
+
+
+# ============================================================
+# PDF WORKERS
+# ============================================================
+
+# MuPDF holds the GIL while it parses, so large Thong tu PDFs are
+# extracted in worker processes instead of on the event loop
+PDF_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Workers are spawned, not forked: the crawler process already runs an
+# event loop plus to_thread/httpx threads, and a forked child can
+# inherit a lock held by one of them
+PDF_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _pymupdf_extract(pdf_bytes: bytes) -> tuple:
+    """
+    Extract raw page text from PDF bytes (runs in a PDF worker process).
+
+    Returns (text, num_pages); pages are joined with "--- Trang N ---"
+    headers, empty pages are skipped. MuPDF errors are re-raised as
+    RuntimeError, since they can't be pickled back to the crawler.
+    """
+    try:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            text_parts = []
+            for page_num, page in enumerate(doc, 1):
+                text = page.get_text("text").strip()
+                if text:
+                    text_parts.append(f"--- Trang {page_num} ---\n{text}")
+            return "\n\n".join(text_parts), len(doc)
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
 @dataclass
 class ExchangeRateData:
     """Exchange rate data structure."""
@@ -168,6 +240,10 @@ class SBVCrawler(BaseCrawler):
         # Old: ["SJC", "TPBank", "BaoTinMinhChau"] via SBV API
         self.gold_price_banks = ["SJC"]
         
+        # PDF worker pool, created on first PDF; closed by aclose() (run()
+        # closes it itself)
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -176,9 +252,13 @@ class SBVCrawler(BaseCrawler):
             "Connection": "keep-alive",
         }
         
-        # Rate limiting
-        self._last_request = 0
-        self._min_interval = 2.0  # seconds between requests
+        # Rate limiting (next free request slot per host)
+        self._next_request: Dict[str, float] = {}
+        self._min_interval = 2.0  # seconds between requests to sbv.gov.vn
+        
+        # Conditional GET cache (see _cached_get)
+        self.http_cache_dir = self.data_dir / "http_cache" / "sbv"
+        self.http_cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Transformer instance
         self._transformer = SBVTransformer()
@@ -187,14 +267,102 @@ class SBVCrawler(BaseCrawler):
     def transformer(self) -> SBVTransformer:
         """Return the SBV transformer instance."""
         return self._transformer
+    
+    async def aclose(self) -> None:
+        """
+        Shut down the PDF worker pool, if one was started.
         
-    async def _rate_limit(self):
-        """Ensure minimum interval between requests."""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
-        self._last_request = asyncio.get_event_loop().time()
+        Called at the end of run(); callers using fetch_article_content()
+        directly should use the crawler as an async context manager:
+        
+            async with SBVCrawler(data_dir) as crawler:
+                article = await crawler.fetch_article_content(url)
+        """
+        if self._pdf_pool is not None:
+            pool, self._pdf_pool = self._pdf_pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+    
+    async def __aenter__(self) -> "SBVCrawler":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+        
+    async def _rate_limit(self, url: str):
+        """
+        Ensure minimum interval between requests to the host of url.
+        
+        Each caller reserves the next free slot before sleeping, so the
+        spacing also holds for sub-pages fetched concurrently. Hosts are
+        spaced independently (see HOST_MIN_INTERVALS).
+        """
+        host = (urlsplit(url).hostname or "").removeprefix("www.")
+        interval = HOST_MIN_INTERVALS.get(host, self._min_interval)
+        
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_request.get(host, 0.0))
+        self._next_request[host] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _cached_get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """
+        GET a page, revalidating against the on-disk HTTP cache.
+        
+        Responses with an ETag or Last-Modified header are stored in
+        http_cache_dir; the next GET sends If-None-Match/If-Modified-Since
+        and, on 304 Not Modified, the stored body is returned as a 200
+        response so callers read it as usual. Pages without validators
+        are never cached.
+        """
+        key = hashlib.sha1(url.encode()).hexdigest()
+        meta_file = self.http_cache_dir / f"{key}.json"
+        body_file = self.http_cache_dir / f"{key}.body"
+        
+        meta = None
+        headers = self.headers
+        try:
+            meta = orjson.loads(meta_file.read_bytes())
+            headers = {**self.headers, **meta["validators"]}
+        except (OSError, orjson.JSONDecodeError, KeyError):
+            pass
+        
+        response = await client.get(url, headers=headers)
+        
+        if response.status_code == 304 and meta:
+            try:
+                body = body_file.read_bytes()
+            except OSError:
+                # Stored body gone: drop the entry and fetch (and cache) again
+                meta_file.unlink(missing_ok=True)
+                return await self._cached_get(client, url)
+            logger.debug(f"[SBV] Not modified, using cached {url}")
+            return httpx.Response(
+                200,
+                headers={"Content-Type": meta.get("content_type", "")},
+                content=body,
+                request=response.request,
+            )
+        
+        if response.status_code == 200:
+            validators = {}
+            if "etag" in response.headers:
+                validators["If-None-Match"] = response.headers["etag"]
+            if "last-modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["last-modified"]
+            
+            if validators:
+                try:
+                    body_file.write_bytes(response.content)
+                    meta_file.write_bytes(orjson.dumps({
+                        "url": url,
+                        "validators": validators,
+                        "content_type": response.headers.get("content-type", ""),
+                    }))
+                except OSError as e:
+                    logger.warning(f"[SBV] Could not cache {url}: {e}")
+        
+        return response
 
     def _make_absolute_url(self, href: str) -> str:
         """Convert relative URL to absolute URL."""
@@ -219,19 +387,17 @@ class SBVCrawler(BaseCrawler):
         errors = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.base_url)
             
             async with httpx.AsyncClient(
                 timeout=30.0,
                 follow_redirects=True,
                 verify=settings.CRAWLERS_ENABLE_SSL
             ) as client:
-                response = await client.get(self.base_url, headers=self.headers)
+                response = await self._cached_get(client, self.base_url)
                 response.raise_for_status()
                 html_content = response.text
                 
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
                 # Extract exchange rate
                 exchange_rate = self._extract_exchange_rate(html_content)
                 if exchange_rate:
@@ -250,122 +416,130 @@ class SBVCrawler(BaseCrawler):
                 # Extract credit data
                 credit_data = self._extract_credit_data(html_content)
                 if credit_data:
-                    for cd in credit_data:
-                        all_data.append({
-                            "name": "Dư nợ tín dụng",
-                            "value": cd.value,
-                            "unit": cd.unit,
-                            "date": cd.date,
-                            "source": "SBV",
-                            "source_url": cd.source_url,
-                            "type": "credit",
-                            "category": "credit"
-                        })
+                    all_data.extend({
+                        "name": "Dư nợ tín dụng",
+                        "value": cd.value,
+                        "unit": cd.unit,
+                        "date": cd.date,
+                        "source": "SBV",
+                        "source_url": cd.source_url,
+                        "type": "credit",
+                        "category": "credit"
+                    } for cd in credit_data)
                     logger.info(f"[SBV] Extracted {len(credit_data)} credit data points")
                 
-                # Extract gold prices from API
-                gold_prices = await self._fetch_gold_prices(client)
+                # Sub-pages are independent (each handles its own errors),
+                # so fetch them concurrently; _rate_limit still spaces the
+                # request starts. The homepage tree (only needed for news
+                # below) is built in a worker thread meanwhile, so the
+                # parse overlaps the downloads instead of preceding them.
+                (
+                    soup,
+                    gold_prices,
+                    (policy_rates, interbank_rates),
+                    cpi_data,
+                    omo_data,
+                ) = await asyncio.gather(
+                    asyncio.to_thread(make_soup, html_content),
+                    self._fetch_gold_prices(client),
+                    self._fetch_interest_rates(client),
+                    self._fetch_cpi(client),
+                    self._fetch_omo(client),
+                )
+                
+                # Gold prices from API
                 if gold_prices:
-                    for gp in gold_prices:
-                        all_data.append({
-                            "name": f"Giá vàng {gp.gold_type}",
-                            "organization": gp.organization,
-                            "gold_type": gp.gold_type,
-                            "buy_price": gp.buy_price,
-                            "sell_price": gp.sell_price,
-                            "weight_unit": gp.weight_unit,
-                            "price_unit": gp.price_unit,
-                            "date": gp.date,
-                            "updated_at": gp.updated_at,
-                            "source": f"SBV/{gp.source}",
-                            "source_url": gp.source_url,
-                            "type": "gold_price",
-                            "category": "commodity"
-                        })
+                    all_data.extend({
+                        "name": f"Giá vàng {gp.gold_type}",
+                        "organization": gp.organization,
+                        "gold_type": gp.gold_type,
+                        "buy_price": gp.buy_price,
+                        "sell_price": gp.sell_price,
+                        "weight_unit": gp.weight_unit,
+                        "price_unit": gp.price_unit,
+                        "date": gp.date,
+                        "updated_at": gp.updated_at,
+                        "source": f"SBV/{gp.source}",
+                        "source_url": gp.source_url,
+                        "type": "gold_price",
+                        "category": "commodity"
+                    } for gp in gold_prices)
                     logger.info(f"[SBV] Extracted {len(gold_prices)} gold price items")
                 
-                # Extract interest rates (policy rates and interbank rates)
-                policy_rates, interbank_rates = await self._fetch_interest_rates(client)
-                
+                # Interest rates (policy rates and interbank rates)
                 if policy_rates:
-                    for pr in policy_rates:
-                        all_data.append({
-                            "name": f"Lãi suất {pr.rate_type}",
-                            "rate_type": pr.rate_type,
-                            "value": pr.value,
-                            "unit": "%",
-                            "decision": pr.decision,
-                            "effective_date": pr.effective_date,
-                            "source": "SBV",
-                            "source_url": pr.source_url,
-                            "type": "policy_rate",
-                            "category": "interest_rate"
-                        })
+                    all_data.extend({
+                        "name": f"Lãi suất {pr.rate_type}",
+                        "rate_type": pr.rate_type,
+                        "value": pr.value,
+                        "unit": "%",
+                        "decision": pr.decision,
+                        "effective_date": pr.effective_date,
+                        "source": "SBV",
+                        "source_url": pr.source_url,
+                        "type": "policy_rate",
+                        "category": "interest_rate"
+                    } for pr in policy_rates)
                     logger.info(f"[SBV] Extracted {len(policy_rates)} policy rates")
                 
                 if interbank_rates:
-                    for ir in interbank_rates:
-                        all_data.append({
-                            "name": f"Lãi suất liên ngân hàng {ir.term}",
-                            "term": ir.term,
-                            "avg_rate": ir.avg_rate,
-                            "volume": ir.volume,
-                            "unit_rate": "% năm",
-                            "unit_volume": "Tỷ đồng",
-                            "date": ir.date,
-                            "note": ir.note,
-                            "source": "SBV",
-                            "source_url": ir.source_url,
-                            "type": "interbank_rate",
-                            "category": "interest_rate"
-                        })
+                    all_data.extend({
+                        "name": f"Lãi suất liên ngân hàng {ir.term}",
+                        "term": ir.term,
+                        "avg_rate": ir.avg_rate,
+                        "volume": ir.volume,
+                        "unit_rate": "% năm",
+                        "unit_volume": "Tỷ đồng",
+                        "date": ir.date,
+                        "note": ir.note,
+                        "source": "SBV",
+                        "source_url": ir.source_url,
+                        "type": "interbank_rate",
+                        "category": "interest_rate"
+                    } for ir in interbank_rates)
                     logger.info(f"[SBV] Extracted {len(interbank_rates)} interbank rates")
                 
-                # Extract CPI data
-                cpi_data = await self._fetch_cpi(client)
+                # CPI data
                 if cpi_data:
-                    for cpi in cpi_data:
-                        all_data.append({
-                            "name": f"CPI {cpi.month}/{cpi.year}",
-                            "value": cpi.mom_change,
-                            "unit": "%",
-                            "date": cpi.publish_date or f"{cpi.year}-{cpi.month:02d}-01",
-                            "source": "SBV/GSO",
-                            "source_url": cpi.source_url,
-                            "type": "cpi",
-                            "category": "inflation",
-                            "month": cpi.month,
-                            "year": cpi.year,
-                            "mom_change": cpi.mom_change,
-                            "ytd_change": cpi.ytd_change,
-                            "yoy_change": cpi.yoy_change,
-                            "core_inflation": cpi.core_inflation,
-                            "title": cpi.title,
-                            "summary": cpi.summary
-                        })
+                    all_data.extend({
+                        "name": f"CPI {cpi.month}/{cpi.year}",
+                        "value": cpi.mom_change,
+                        "unit": "%",
+                        "date": cpi.publish_date or f"{cpi.year}-{cpi.month:02d}-01",
+                        "source": "SBV/GSO",
+                        "source_url": cpi.source_url,
+                        "type": "cpi",
+                        "category": "inflation",
+                        "month": cpi.month,
+                        "year": cpi.year,
+                        "mom_change": cpi.mom_change,
+                        "ytd_change": cpi.ytd_change,
+                        "yoy_change": cpi.yoy_change,
+                        "core_inflation": cpi.core_inflation,
+                        "title": cpi.title,
+                        "summary": cpi.summary
+                    } for cpi in cpi_data)
                     logger.info(f"[SBV] Extracted {len(cpi_data)} CPI data points")
                 
-                # Extract OMO data
-                omo_data = await self._fetch_omo(client)
+                # OMO data
                 if omo_data:
-                    for omo in omo_data:
-                        all_data.append({
-                            "name": f"OMO {omo.transaction_type} Phiên {omo.auction_round} {omo.term}",
-                            "transaction_type": omo.transaction_type,
-                            "auction_round": omo.auction_round,
-                            "term": omo.term,
-                            "participants": omo.participants,
-                            "volume": omo.volume,
-                            "interest_rate": omo.interest_rate,
-                            "unit_volume": "Tỷ đồng",
-                            "unit_rate": "% năm",
-                            "date": omo.date,
-                            "is_total": omo.is_total,
-                            "source": "SBV",
-                            "source_url": omo.source_url,
-                            "type": "omo",
-                            "category": "monetary_policy"
-                        })
+                    all_data.extend({
+                        "name": f"OMO {omo.transaction_type} Phiên {omo.auction_round} {omo.term}",
+                        "transaction_type": omo.transaction_type,
+                        "auction_round": omo.auction_round,
+                        "term": omo.term,
+                        "participants": omo.participants,
+                        "volume": omo.volume,
+                        "interest_rate": omo.interest_rate,
+                        "unit_volume": "Tỷ đồng",
+                        "unit_rate": "% năm",
+                        "date": omo.date,
+                        "is_total": omo.is_total,
+                        "source": "SBV",
+                        "source_url": omo.source_url,
+                        "type": "omo",
+                        "category": "monetary_policy"
+                    } for omo in omo_data)
                     logger.info(f"[SBV] Extracted {len(omo_data)} OMO data points")
                 
                 # Extract news
@@ -377,19 +551,19 @@ class SBVCrawler(BaseCrawler):
                 logger.info(f"[SBV] Extracted {len(press_releases)} press releases")
                 
                 # Convert news to dict format for unified storage
-                for item in news_items + press_releases:
-                    all_data.append({
-                        "name": f"SBV {item.category}",
-                        "value": 0,
-                        "unit": "text",
-                        "date": item.date or datetime.now().strftime("%Y-%m-%d"),
-                        "source": "SBV",
-                        "source_url": item.url,
-                        "type": item.category,
-                        "category": "news",
-                        "title": item.title,
-                        "summary": item.summary
-                    })
+                today = datetime.now().strftime("%Y-%m-%d")
+                all_data.extend({
+                    "name": f"SBV {item.category}",
+                    "value": 0,
+                    "unit": "text",
+                    "date": item.date or today,
+                    "source": "SBV",
+                    "source_url": item.url,
+                    "type": item.category,
+                    "category": "news",
+                    "title": item.title,
+                    "summary": item.summary
+                } for item in chain(news_items, press_releases))
                     
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error {e.response.status_code}: {str(e)}"
@@ -425,15 +599,17 @@ class SBVCrawler(BaseCrawler):
         var dates = ["21-10-2025", "22-10-2025", ...];
         """
         try:
-            rate_match = re.search(r'var\s+tyGiaValues\s*=\s*\[([\d,\s]+)\]', html_content)
-            date_match = re.search(r'var\s+dates\s*=\s*\[(.*?)\]', html_content, re.DOTALL)
+            rate_match = EXCHANGE_RATE_VALUES_PATTERN.search(html_content)
+            date_match = EXCHANGE_RATE_DATES_PATTERN.search(html_content)
             
             if rate_match and date_match:
-                rates = [float(r.strip()) for r in rate_match.group(1).split(',') if r.strip()]
-                dates = re.findall(r'"([^"]+)"', date_match.group(1))
+                # Only the latest point is needed, so convert just that
+                # one (fetch_exchange_rate_history parses the full series)
+                rates = [r for r in rate_match.group(1).split(',') if r.strip()]
+                dates = QUOTED_STRING_PATTERN.findall(date_match.group(1))
                 
                 if rates and dates:
-                    latest_rate = rates[-1]
+                    latest_rate = float(rates[-1])
                     latest_date = dates[-1] if dates else datetime.now().strftime("%d-%m-%Y")
                     
                     try:
@@ -460,12 +636,12 @@ class SBVCrawler(BaseCrawler):
         credit_data = []
         
         try:
-            values_match = re.search(r'var\s+ChartDuNoValues\s*=\s*\[(.*?)\]', html_content, re.DOTALL)
-            labels_match = re.search(r'var\s+ChartDuNoLabels\s*=\s*\[(.*?)\]', html_content, re.DOTALL)
+            values_match = CREDIT_VALUES_PATTERN.search(html_content)
+            labels_match = CREDIT_LABELS_PATTERN.search(html_content)
             
             if values_match and labels_match:
-                values = re.findall(r'"([^"]+)"', values_match.group(1))
-                labels = re.findall(r'"([^"]+)"', labels_match.group(1))
+                values = QUOTED_STRING_PATTERN.findall(values_match.group(1))
+                labels = QUOTED_STRING_PATTERN.findall(labels_match.group(1))
                 
                 for value, label in zip(values, labels):
                     try:
@@ -503,23 +679,25 @@ class SBVCrawler(BaseCrawler):
         gold_prices = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.gold_price_api)
             
             url = self.gold_price_api
             logger.info(f"[SBV] Fetching gold prices from SJC...")
             
-            response = await client.get(url, headers=self.headers)
+            response = await self._cached_get(client, url)
             response.raise_for_status()
             
-            # Check for empty response
-            if not response.text or response.text.strip() == '':
+            # Check for empty response (on the raw bytes, no text decode)
+            body = response.content.strip()
+            if not body:
                 logger.warning(f"[SBV] Gold price API returned empty response")
                 return gold_prices
             
-            # Parse JSON response
+            # Parse JSON response (orjson reads the UTF-8 bytes directly,
+            # but unlike json.loads doesn't skip a BOM)
             try:
-                data = response.json()
-            except Exception as json_err:
+                data = orjson.loads(body.removeprefix(codecs.BOM_UTF8))
+            except orjson.JSONDecodeError as json_err:
                 logger.error(f"[SBV] Failed to parse gold price JSON: {json_err}")
                 return gold_prices
             
@@ -569,68 +747,6 @@ class SBVCrawler(BaseCrawler):
         
         return gold_prices
     
-    def _parse_gold_price_xml(self, xml_text: str, bank: str) -> List[Dict[str, Any]]:
-        """
-        Parse gold price data from XML response.
-        
-        XML format:
-        <HashMap xmlns="">
-            <goldPriceItems>
-                <tenToChuc>...</tenToChuc>
-                <khoiLuong>...</khoiLuong>
-                ...
-            </goldPriceItems>
-            <status>success</status>
-        </HashMap>
-        """
-        items = []
-        
-        try:
-            soup = BeautifulSoup(xml_text, 'html.parser')
-            
-            # Check status
-            status_elem = soup.find('status')
-            if status_elem and status_elem.get_text(strip=True) != 'success':
-                logger.warning(f"[SBV] Gold price XML returned non-success status for {bank}")
-                return items
-            
-            # Find all goldPriceItems elements
-            gold_items = soup.find_all('goldpriceitems')
-            
-            for item_elem in gold_items:
-                item = {}
-                
-                # Extract all child elements
-                for child in item_elem.children:
-                    if hasattr(child, 'name') and child.name:
-                        # Convert tag name to camelCase key
-                        tag_name = child.name.lower()
-                        # Map XML tags to expected JSON keys
-                        key_map = {
-                            'tentochuc': 'tenToChuc',
-                            'khoiluong': 'khoiLuong',
-                            'ngaydulieu': 'ngayDuLieu',
-                            'loaivang': 'loaiVang',
-                            'giamuaniemyet': 'giaMuaNiemYet',
-                            'giabaniemyet': 'giaBanNiemYet',
-                            'ngaycapnhat': 'ngayCapNhat',
-                            'donvitinh': 'donViTinh'
-                        }
-                        key = key_map.get(tag_name, tag_name)
-                        item[key] = child.get_text(strip=True)
-                
-                if item:
-                    items.append(item)
-            
-            logger.debug(f"[SBV] Parsed {len(items)} items from XML for {bank}")
-            
-        except Exception as e:
-            logger.error(f"[SBV] Error parsing gold price XML for {bank}: {e}")
-        
-        return items
-        
-        return gold_prices
-    
     async def fetch_gold_prices(self, banks: Optional[List[str]] = None) -> List[GoldPriceData]:
         """
         Public method to fetch gold prices.
@@ -663,14 +779,14 @@ class SBVCrawler(BaseCrawler):
         interbank_rates = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.interest_rate_url)
             
             logger.info(f"[SBV] Fetching interest rates from {self.interest_rate_url}...")
             
-            response = await client.get(self.interest_rate_url, headers=self.headers)
+            response = await self._cached_get(client, self.interest_rate_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             # Extract policy rates (Bảng lãi suất)
             policy_rates = self._extract_policy_rates(soup)
@@ -909,14 +1025,14 @@ class SBVCrawler(BaseCrawler):
         cpi_data = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.cpi_url)
             
             logger.info(f"[SBV] Fetching CPI data from {self.cpi_url}...")
             
-            response = await client.get(self.cpi_url, headers=self.headers)
+            response = await self._cached_get(client, self.cpi_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             cpi_data = self._extract_cpi_news(soup, max_items)
             
         except httpx.HTTPStatusError as e:
@@ -1162,14 +1278,14 @@ class SBVCrawler(BaseCrawler):
         omo_data = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.omo_url)
             
             logger.info(f"[SBV] Fetching OMO data from {self.omo_url}...")
             
-            response = await client.get(self.omo_url, headers=self.headers)
+            response = await self._cached_get(client, self.omo_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             omo_data = self._extract_omo_results(soup)
             
         except httpx.HTTPStatusError as e:
@@ -1455,7 +1571,7 @@ class SBVCrawler(BaseCrawler):
         Returns:
             Dict with title, content, date, attachments, pdf_content, etc.
         """
-        await self._rate_limit()
+        await self._rate_limit(url)
         
         try:
             async with httpx.AsyncClient(
@@ -1466,7 +1582,7 @@ class SBVCrawler(BaseCrawler):
                 response = await client.get(url, headers=self.headers)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
                 
                 # Initialize result
                 result = {
@@ -1620,7 +1736,7 @@ class SBVCrawler(BaseCrawler):
         content_elem = soup.find('div', class_='article-content')
         
         if content_elem:
-            content_copy = BeautifulSoup(str(content_elem), 'html.parser')
+            content_copy = make_soup(str(content_elem))
             
             # Remove unwanted elements
             unwanted_selectors = [
@@ -1699,7 +1815,7 @@ class SBVCrawler(BaseCrawler):
         # Try print-content div
         print_content = soup.find('div', {'id': 'print-content'})
         if print_content:
-            print_content = clean_content_div(BeautifulSoup(str(print_content), 'html.parser'))
+            print_content = clean_content_div(make_soup(str(print_content)))
             text = print_content.get_text(separator='\n', strip=True)
             # Clean up excessive whitespace
             lines = [line.strip() for line in text.split('\n') if line.strip()]
@@ -1708,7 +1824,7 @@ class SBVCrawler(BaseCrawler):
         # Try journal-content-article
         journal_content = soup.find('div', class_='journal-content-article')
         if journal_content:
-            journal_content = clean_content_div(BeautifulSoup(str(journal_content), 'html.parser'))
+            journal_content = clean_content_div(make_soup(str(journal_content)))
             text = journal_content.get_text(separator='\n', strip=True)
             lines = [line.strip() for line in text.split('\n') if line.strip()]
             return '\n'.join(lines)
@@ -1739,15 +1855,27 @@ class SBVCrawler(BaseCrawler):
         attachments: List[Dict], 
         client: httpx.AsyncClient
     ) -> List[Dict]:
-        """Extract text from all PDF attachments."""
+        """
+        Extract text from all PDF attachments.
+        
+        Up to MAX_CONCURRENT_PDFS downloads run at once (starts still
+        spaced by _rate_limit), so one PDF downloads while another is
+        parsed in the PDF pool.
+        """
         pdf_content = []
         pdf_attachments = [att for att in attachments if att["type"] == "pdf"]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PDFS)
         
-        for att in pdf_attachments:
-            logger.info(f"[SBV] Extracting PDF: {att['name'][:50]}...")
-            
-            pdf_result = await self._download_and_extract_pdf(att["url"], client)
-            
+        async def extract_bounded(att: Dict) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                logger.info(f"[SBV] Extracting PDF: {att['name'][:50]}...")
+                return await self._download_and_extract_pdf(att["url"], client)
+        
+        pdf_results = await asyncio.gather(*(
+            extract_bounded(att) for att in pdf_attachments
+        ))
+        
+        for att, pdf_result in zip(pdf_attachments, pdf_results):
             if pdf_result and pdf_result.get("text"):
                 pdf_content.append({
                     "name": att["name"],
@@ -1781,7 +1909,7 @@ class SBVCrawler(BaseCrawler):
         
         for attempt in range(MAX_RETRIES):
             try:
-                await self._rate_limit()
+                await self._rate_limit(url)
                 
                 # Create dedicated client with longer timeout for PDF downloads
                 async with httpx.AsyncClient(
@@ -1840,7 +1968,7 @@ class SBVCrawler(BaseCrawler):
                         logger.warning(f"[SBV] PDF too large ({len(pdf_bytes) / 1024 / 1024:.1f}MB > {MAX_PDF_SIZE / 1024 / 1024:.0f}MB), skipping: {url[:60]}...")
                         return None
                     
-                    text_content = self._extract_text_from_pdf_bytes(pdf_bytes)
+                    text_content = await self._extract_pdf_text(pdf_bytes)
                     
                     if text_content:
                         return {
@@ -1880,26 +2008,21 @@ class SBVCrawler(BaseCrawler):
         
         return None
     
-    def _extract_text_from_pdf_bytes(self, pdf_bytes: bytes) -> str:
-        """Extract text from PDF bytes using PyMuPDF."""
+    async def _extract_pdf_text(self, pdf_bytes: bytes) -> str:
+        """Extract text from PDF bytes using PyMuPDF in the PDF worker pool."""
         if not PDF_SUPPORT:
             return ""
         
-        doc = None
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS, mp_context=PDF_MP_CONTEXT
+            )
+        
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            
-            text_parts = []
-            num_pages = len(doc)
-            
-            for page_num in range(num_pages):
-                page = doc[page_num]
-                text = page.get_text("text")
-                
-                if text.strip():
-                    text_parts.append(f"--- Trang {page_num + 1} ---\n{text.strip()}")
-            
-            full_text = "\n\n".join(text_parts)
+            loop = asyncio.get_running_loop()
+            full_text, num_pages = await loop.run_in_executor(
+                self._pdf_pool, _pymupdf_extract, pdf_bytes
+            )
             full_text = self._clean_pdf_text(full_text)
             
             logger.info(f"[SBV] Extracted {len(full_text)} chars from PDF ({num_pages} pages)")
@@ -1908,9 +2031,6 @@ class SBVCrawler(BaseCrawler):
         except Exception as e:
             logger.error(f"[SBV] Error parsing PDF: {e}")
             return ""
-        finally:
-            if doc:
-                doc.close()
     
     def _clean_pdf_text(self, text: str) -> str:
         """Clean up extracted PDF text."""
@@ -1946,23 +2066,29 @@ class SBVCrawler(BaseCrawler):
         if not date_text:
             return ""
         
-        date_formats = [
-            "%d/%m/%Y %H:%M:%S",
-            "%d/%m/%Y %H:%M",
-            "%d/%m/%Y",
-            "%d-%m-%Y %H:%M:%S",
-            "%d-%m-%Y",
-            "%Y-%m-%d",
-        ]
+        text = date_text.strip()
+        has_time = ":" in text
+        
+        # Pick the candidate formats from the separators instead of
+        # trying (and raising on) each one: "19/06/2023 08:00",
+        # "19-06-2023", "2023-06-19"
+        if "/" in text:
+            date_formats = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M") if has_time else ("%d/%m/%Y",)
+        elif text[4:5] == "-" and text[:4].isdigit():
+            date_formats = ("%Y-%m-%d",)
+        elif "-" in text:
+            date_formats = ("%d-%m-%Y %H:%M:%S",) if has_time else ("%d-%m-%Y",)
+        else:
+            return text
         
         for fmt in date_formats:
             try:
-                dt = datetime.strptime(date_text.strip(), fmt)
-                return dt.strftime("%Y-%m-%d %H:%M:%S") if ":" in date_text else dt.strftime("%Y-%m-%d")
+                dt = datetime.strptime(text, fmt)
+                return dt.strftime("%Y-%m-%d %H:%M:%S") if has_time else dt.strftime("%Y-%m-%d")
             except ValueError:
                 continue
         
-        return date_text.strip()
+        return text
     
     def _get_file_type(self, url: str) -> str:
         """Determine file type from URL."""
@@ -1986,23 +2112,23 @@ class SBVCrawler(BaseCrawler):
         rates = []
         
         try:
-            await self._rate_limit()
+            await self._rate_limit(self.base_url)
             
             async with httpx.AsyncClient(
                 timeout=30.0,
                 follow_redirects=True,
                 verify=settings.CRAWLERS_ENABLE_SSL
             ) as client:
-                response = await client.get(self.base_url, headers=self.headers)
+                response = await self._cached_get(client, self.base_url)
                 response.raise_for_status()
                 html_content = response.text
                 
-                rate_match = re.search(r'var\s+tyGiaValues\s*=\s*\[([\d,\s]+)\]', html_content)
-                date_match = re.search(r'var\s+dates\s*=\s*\[(.*?)\]', html_content, re.DOTALL)
+                rate_match = EXCHANGE_RATE_VALUES_PATTERN.search(html_content)
+                date_match = EXCHANGE_RATE_DATES_PATTERN.search(html_content)
                 
                 if rate_match and date_match:
                     rate_values = [float(r.strip()) for r in rate_match.group(1).split(',') if r.strip()]
-                    date_values = re.findall(r'"([^"]+)"', date_match.group(1))
+                    date_values = QUOTED_STRING_PATTERN.findall(date_match.group(1))
                     
                     for rate, date in list(zip(rate_values, date_values))[-days:]:
                         try:
@@ -2203,6 +2329,8 @@ class SBVCrawler(BaseCrawler):
             error_msg = f"Unexpected error in run: {str(e)}"
             logger.exception(f"[{self.name}] {error_msg}")
             errors.append(error_msg)
+        finally:
+            await self.aclose()
         
         # Create result with stats metadata
         result = CrawlResult(
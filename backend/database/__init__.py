@@ -7,6 +7,7 @@ Structure:
     database/
     ├── __init__.py      # This file - public API
     ├── session.py       # SQLAlchemy async session management
+    ├── pool.py          # aiosqlite connection pools for API reads/writes
     ├── init.py          # Database initialization utilities
     └── models/          # SQLAlchemy ORM models
         ├── __init__.py
@@ -53,6 +54,7 @@ from .models import (
     # System
     RunHistory,
     CalendarEvent,
+    KVCache,
 )
 
 # Session Management
@@ -66,6 +68,17 @@ from .session import (
     get_connection,
 )
 
+# Connection Pools (API endpoints)
+from .pool import (
+    ConnectionPool,
+    init_pool,
+    close_pool,
+    get_pool,
+    get_write_pool,
+    get_db,
+    get_write_db,
+)
+
 # Initialization utilities
 from .init import (
     init_database,
@@ -100,6 +113,7 @@ __all__ = [
     "SignalAccuracyStats",
     "RunHistory",
     "CalendarEvent",
+    "KVCache",
     # Session Management
     "init_engine",
     "close_engine",
@@ -108,6 +122,14 @@ __all__ = [
     "get_session",
     "get_session_dependency",
     "get_connection",
+    # Connection Pool
+    "ConnectionPool",
+    "init_pool",
+    "close_pool",
+    "get_pool",
+    "get_write_pool",
+    "get_db",
+    "get_write_db",
     # Init utilities
     "init_database",
     "init_database_async",
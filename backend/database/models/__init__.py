@@ -13,7 +13,7 @@ from .base import Base, TimestampMixin
 from .indicators import Indicator, IndicatorHistory
 from .events import Event, CausalAnalysis, TopicFrequency, ScoreHistory
 from .insights import Signal, Theme, Watchlist, SignalAccuracyStats
-from .system import RunHistory, CalendarEvent
+from .system import RunHistory, CalendarEvent, KVCache
 from .llm_history import LLMCallHistory
 
 __all__ = [
@@ -36,6 +36,7 @@ __all__ = [
     # System
     "RunHistory",
     "CalendarEvent",
+    "KVCache",
     # LLM
     "LLMCallHistory",
 ]
@@ -6,7 +6,7 @@ Models for news events, causal analysis, and topic tracking.
 from datetime import datetime, date
 from typing import Optional, List, Any
 
-from sqlalchemy import String, Float, Integer, Boolean, Date, DateTime, Text, Index, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Float, Integer, Boolean, Date, DateTime, Text, Index, JSON, ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -78,11 +78,13 @@ class Event(Base, TimestampMixin):
     
     # Indexes
     __table_args__ = (
-        Index('idx_events_display', 'display_section', 'current_score'),
+        Index('idx_events_display_score', 'display_section', 'current_score', 'published_at'),
         Index('idx_events_date', 'published_at'),
-        Index('idx_events_run_date', 'run_date'),
+        Index('idx_events_run_date_score', 'run_date', 'current_score'),
         Index('idx_events_category', 'category'),
         Index('idx_events_hash', 'hash'),
+        Index('idx_events_section_published', 'display_section', text("COALESCE(published_at, '')"), 'id'),
+        Index('idx_events_last_ranked', 'last_ranked_at'),
     )
 
 
@@ -145,6 +147,11 @@ class TopicFrequency(Base):
     last_seen: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     related_event_ids: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
     is_hot: Mapped[bool] = mapped_column(Boolean, default=False)
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_topic_frequency_hot', 'is_hot', 'occurrence_count'),
+    )
 
 
 class ScoreHistory(Base):
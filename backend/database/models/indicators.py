@@ -6,7 +6,7 @@ Models for market indicators and their historical values.
 from datetime import datetime, date
 from typing import Optional, List
 
-from sqlalchemy import String, Float, Date, DateTime, Text, Index, UniqueConstraint, ForeignKey
+from sqlalchemy import String, Float, Date, DateTime, Text, Index, UniqueConstraint, ForeignKey, Computed, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -38,6 +38,16 @@ class Indicator(Base, TimestampMixin):
     category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     subcategory: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
+    # Region from the category prefix (generated by SQLite, never written)
+    region: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        Computed(
+            "CASE WHEN category LIKE 'vietnam%' THEN 'vietnam' "
+            "WHEN category LIKE 'global%' THEN 'global' ELSE 'other' END",
+            persisted=False
+        )
+    )
+    
     # Current value
     value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     unit: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -61,6 +71,12 @@ class Indicator(Base, TimestampMixin):
         cascade="all, delete-orphan",
         order_by="desc(IndicatorHistory.date)"
     )
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_indicators_category', 'category', 'name'),
+        Index('idx_indicators_region_updated', 'region', text('updated_at DESC')),
+    )
 
 
 class IndicatorHistory(Base):
@@ -83,4 +83,6 @@ class Signal(Base, TimestampMixin):
     __table_args__ = (
         Index('idx_signals_status_expires', 'status', 'expires_at'),
         Index('idx_signals_confidence', 'confidence'),
+        Index('idx_signals_theme_status', 'theme_id', 'status', 'expires_at'),
+        Index('idx_signals_source_event', 'source_event_id'),
     )
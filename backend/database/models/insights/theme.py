@@ -6,7 +6,7 @@ Aggregated topic from multiple related events.
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Float, DateTime, Text, Index, JSON
+from sqlalchemy import String, Integer, Float, DateTime, Text, Index, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import Base, TimestampMixin
@@ -95,6 +95,15 @@ class Theme(Base, TimestampMixin):
     # Count of correct signals
     signals_correct_count: Mapped[int] = mapped_column(Integer, default=0)
     
+    # Composite priority (0-100) used to order /trends
+    # Updated by: ThemeRepository.refresh_priority_scores (each pipeline run)
+    priority_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    
+    # Keyword category from the theme name (monetary, forex, ..., other)
+    # Used in: TrendsPanel category badges and grouping
+    # Updated by: ThemeRepository.refresh_priority_scores (each pipeline run)
+    category: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    
     # Relationships - use string reference to avoid circular import
     signals: Mapped[List["Signal"]] = relationship(
         "Signal",
@@ -105,4 +114,8 @@ class Theme(Base, TimestampMixin):
     # Indexes
     __table_args__ = (
         Index('idx_themes_status_strength', 'status', 'strength'),
+        Index(
+            'idx_themes_priority', 'status', text('priority_score DESC'),
+            sqlite_where=text('urgency IS NOT NULL')
+        ),
     )
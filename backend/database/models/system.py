@@ -45,6 +45,11 @@ class RunHistory(Base):
     # Result
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # 'success', 'partial', 'failed'
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_run_history_run_time', 'run_time'),
+    )
 
 
 class CalendarEvent(Base):
@@ -80,4 +85,25 @@ class CalendarEvent(Base):
     __table_args__ = (
         UniqueConstraint('date', 'event_name', 'country', name='uq_calendar_event'),
         Index('idx_calendar_country', 'country'),
+        Index('idx_calendar_date_time', 'date', 'time'),
     )
+
+
+class KVCache(Base):
+    """
+    Precomputed API payloads.
+    
+    Written by the pipeline after the data they summarize changes, so
+    read endpoints can serve them with a single primary key lookup.
+    Values are JSON text.
+    """
+    __tablename__ = "kv_cache"
+    
+    # Primary key
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    
+    # Payload
+    value: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    
+    # Timestamp
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,179 @@
+"""
+Async SQLite Connection Pool
+
+Provides a small pool of long-lived aiosqlite connections for the API
+read endpoints. Replaces opening and closing a sync sqlite3 connection
+on every request, which paid the connect cost each time and blocked the
+event loop while queries ran.
+
+Reads and writes use separate pools: read connections are opened with
+PRAGMA query_only, and the few API writes (trend archive/dismiss) go
+through a single writer connection, so they never queue behind reads
+and never contend with each other for SQLite's write lock.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncGenerator
+
+import aiosqlite
+from loguru import logger
+
+from config import settings
+from .session import SQLITE_PRAGMAS
+
+
+# Number of connections kept open. Each aiosqlite connection runs its
+# queries on a dedicated thread, so this also caps concurrent queries.
+# WAL lets readers run in parallel, so scale with cores (at least 4).
+POOL_SIZE = max(4, min(32, 2 * (os.cpu_count() or 1)))
+
+# Prepared statements kept per connection (sqlite3 default is 128). The
+# API's query texts are fixed, so repeat requests skip parse/plan.
+CACHED_STATEMENTS = 512
+
+# Rows fetched per thread hop when iterating a cursor with `async for`
+# (aiosqlite default is 64). Covers a full list page in one round trip
+# while still bounding memory on larger result sets.
+ITER_CHUNK_SIZE = 256
+
+# Writer connections for API writes. SQLite allows one writer at a time,
+# so more connections would only wait on each other's lock.
+WRITE_POOL_SIZE = 1
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of aiosqlite connections.
+
+    Connections are checked out through an asyncio.Queue, so callers
+    wait (without blocking the event loop) when all connections are busy.
+
+    Usage:
+        async with pool.acquire() as db:
+            async with db.execute("SELECT * FROM indicators") as cursor:
+                rows = await cursor.fetchall()
+    """
+
+    def __init__(self, db_path: Path, size: int = POOL_SIZE, read_only: bool = False):
+        self.db_path = db_path
+        self.size = size
+        self.read_only = read_only
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+
+    async def open(self) -> None:
+        """Open all connections in the pool."""
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(
+                str(self.db_path),
+                iter_chunk_size=ITER_CHUNK_SIZE,
+                cached_statements=CACHED_STATEMENTS
+            )
+            conn.row_factory = aiosqlite.Row
+            for pragma in SQLITE_PRAGMAS:
+                await conn.execute(pragma)
+            if self.read_only:
+                # Reject writes on read connections
+                await conn.execute("PRAGMA query_only=ON")
+            self._connections.append(conn)
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all connections in the pool."""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Check out a connection, returning it to the pool on exit."""
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+
+# Global pool instances (reads, writes)
+_pool: ConnectionPool | None = None
+_write_pool: ConnectionPool | None = None
+
+
+async def init_pool(db_path: Path = None) -> ConnectionPool:
+    """
+    Initialize the read and write connection pools.
+
+    Called once at application startup (see api/main.py lifespan).
+    Returns the read pool.
+    """
+    global _pool, _write_pool
+
+    if _pool is not None:
+        return _pool
+
+    db_path = db_path or settings.DATABASE_PATH
+    _pool = ConnectionPool(db_path, read_only=True)
+    await _pool.open()
+    _write_pool = ConnectionPool(db_path, size=WRITE_POOL_SIZE)
+    await _write_pool.open()
+
+    logger.info(
+        f"Connection pool initialized ({_pool.size} read, "
+        f"{_write_pool.size} write connections)"
+    )
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the connection pools."""
+    global _pool, _write_pool
+
+    if _write_pool is not None:
+        await _write_pool.close()
+        _write_pool = None
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logger.info("Connection pool closed")
+
+
+def get_pool() -> ConnectionPool:
+    """Get the initialized (read-only) connection pool."""
+    if _pool is None:
+        raise RuntimeError("Connection pool not initialized, call init_pool() first")
+    return _pool
+
+
+def get_write_pool() -> ConnectionPool:
+    """Get the initialized writer connection pool."""
+    if _write_pool is None:
+        raise RuntimeError("Connection pool not initialized, call init_pool() first")
+    return _write_pool
+
+
+async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """
+    FastAPI dependency for getting a pooled connection.
+
+    Usage in FastAPI:
+        @router.get("/items")
+        async def get_items(db: aiosqlite.Connection = Depends(get_db)):
+            async with db.execute("SELECT * FROM items") as cursor:
+                rows = await cursor.fetchall()
+    """
+    async with get_pool().acquire() as conn:
+        yield conn
+
+
+async def get_write_db() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """
+    FastAPI dependency for the writer connection.
+
+    For the endpoints that modify data; get_db connections are
+    read-only. Commit (or roll back) before returning.
+    """
+    async with get_write_pool().acquire() as conn:
+        yield conn
@@ -6,6 +6,7 @@ Provides SQLAlchemy engine and session factory for async database access.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -22,6 +23,26 @@ from .models import Base
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
+# Per-connection tuning applied to every SQLite connection we open.
+# WAL lets API reads run while the pipeline writes, NORMAL skips the
+# fsync on every commit (still safe in WAL mode), and the larger page
+# cache / mmap window keep hot pages out of userspace copies.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def apply_pragmas(dbapi_connection) -> None:
+    """Run SQLITE_PRAGMAS on a DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 def get_database_url() -> str:
     """Get async database URL for SQLAlchemy."""
@@ -51,6 +72,10 @@ async def init_engine() -> AsyncEngine:
         connect_args={"check_same_thread": False},
     )
     
+    @event.listens_for(_engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection)
+    
     _session_factory = async_sessionmaker(
         bind=_engine,
         class_=AsyncSession,
@@ -159,11 +184,12 @@ def get_connection(db_path=None):
         conn.close()
     
     Returns a connection with row_factory set to sqlite3.Row
-    so you can access columns by name.
+    so you can access columns by name, tuned with SQLITE_PRAGMAS.
     """
     if db_path is None:
         db_path = settings.DATABASE_PATH
     
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), cached_statements=512)
     conn.row_factory = sqlite3.Row
+    apply_pragmas(conn)
     return conn
@@ -0,0 +1,111 @@
+"""
+006 - Read Path Indexes: Composite indexes for the hottest API queries
+
+Revision ID: 006_read_path_indexes
+Revises: 005_trends_system
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+The dashboard endpoints filter and sort on column combinations that the
+existing single-column indexes don't match, so SQLite falls back to a
+table scan plus a temp B-tree sort on every request:
+- /events/other: display_section = ? ORDER BY published_at DESC
+- /topics/hot: is_hot = TRUE ORDER BY occurrence_count DESC
+- /calendar, /calendar/week: date range ORDER BY date, time
+- /runs/latest and the API cache version: ORDER BY run_time DESC
+- /events/{event_id}: signals WHERE source_event_id = ?
+
+## WHAT THIS MIGRATION DOES:
+Adds composite indexes whose column order matches WHERE then ORDER BY,
+so SQLite can walk the index in order and stop after LIMIT rows.
+idx_calendar_date is replaced by (date, time) which covers the same
+lookups. Runs ANALYZE so the planner has statistics for the new indexes.
+
+Already covered by earlier migrations (left as is):
+- events(display_section, current_score): idx_events_display
+- events(run_date): idx_events_run_date
+- indicator_history(indicator_id, date): idx_indicator_history_lookup
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_read_path_indexes'
+down_revision: Union[str, None] = '005_trends_system'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes for API read queries."""
+
+    # ==================================================
+    # EVENTS
+    # ==================================================
+    with op.batch_alter_table('events') as batch_op:
+        # Other news list: newest first within a section
+        batch_op.create_index(
+            'idx_events_section_published',
+            ['display_section', 'published_at']
+        )
+        # MAX(last_ranked_at) for the API cache version
+        batch_op.create_index('idx_events_last_ranked', ['last_ranked_at'])
+
+    # ==================================================
+    # SIGNALS
+    # ==================================================
+    with op.batch_alter_table('signals') as batch_op:
+        # Related signals on event detail
+        batch_op.create_index('idx_signals_source_event', ['source_event_id'])
+
+    # ==================================================
+    # TOPIC FREQUENCY
+    # ==================================================
+    with op.batch_alter_table('topic_frequency') as batch_op:
+        # Hot topics ordered by occurrence count
+        batch_op.create_index(
+            'idx_topic_frequency_hot',
+            ['is_hot', 'occurrence_count']
+        )
+
+    # ==================================================
+    # CALENDAR EVENTS
+    # ==================================================
+    with op.batch_alter_table('calendar_events') as batch_op:
+        # Date range scans ordered by date, time
+        batch_op.drop_index('idx_calendar_date')
+        batch_op.create_index('idx_calendar_date_time', ['date', 'time'])
+
+    # ==================================================
+    # RUN HISTORY
+    # ==================================================
+    with op.batch_alter_table('run_history') as batch_op:
+        # Latest run lookups
+        batch_op.create_index('idx_run_history_run_time', ['run_time'])
+
+    # Refresh planner statistics so the new indexes are picked up
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    """Remove read path indexes."""
+
+    with op.batch_alter_table('run_history') as batch_op:
+        batch_op.drop_index('idx_run_history_run_time')
+
+    with op.batch_alter_table('calendar_events') as batch_op:
+        batch_op.drop_index('idx_calendar_date_time')
+        batch_op.create_index('idx_calendar_date', ['date'])
+
+    with op.batch_alter_table('topic_frequency') as batch_op:
+        batch_op.drop_index('idx_topic_frequency_hot')
+
+    with op.batch_alter_table('signals') as batch_op:
+        batch_op.drop_index('idx_signals_source_event')
+
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_index('idx_events_last_ranked')
+        batch_op.drop_index('idx_events_section_published')
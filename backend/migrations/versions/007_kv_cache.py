@@ -0,0 +1,46 @@
+"""
+007 - KV Cache: Table for precomputed API payloads
+
+Revision ID: 007_kv_cache
+Revises: 006_read_path_indexes
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+Some API responses only change when the pipeline runs, yet were rebuilt
+from scratch on every request (e.g. /indicators grouped by category).
+
+## WHAT THIS MIGRATION DOES:
+Creates kv_cache, a key -> JSON text table. The pipeline writes the
+payloads at the end of the step that changes them; the API serves them
+with a primary key lookup and no re-serialization.
+
+## KEYS:
+- indicators_grouped: /indicators?grouped=true response body
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_kv_cache'
+down_revision: Union[str, None] = '006_read_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create kv_cache table."""
+    op.create_table(
+        'kv_cache',
+        sa.Column('key', sa.String(100), primary_key=True),
+        # JSON text, served as-is by the API
+        sa.Column('value', sa.Text, nullable=True),
+        sa.Column('updated_at', sa.DateTime, nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop kv_cache table."""
+    op.drop_table('kv_cache')
@@ -0,0 +1,63 @@
+"""
+008 - Theme Priority Score: Persist the trend priority used by /trends
+
+Revision ID: 008_theme_priority_score
+Revises: 007_kv_cache
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+/trends fetched a page ordered by urgency/strength, then re-sorted that
+page in Python by a priority score computed on the fly. Each page was
+sorted on its own, so the overall order (and has_more/offset) didn't
+match what the client displays.
+
+## WHAT THIS MIGRATION DOES:
+Adds themes.priority_score, maintained by the pipeline
+(ThemeRepository.refresh_priority_scores, recompute_trend_stats), so the
+API can ORDER BY priority_score and return the exact page. A partial
+index matches the default /trends filter (urgency IS NOT NULL).
+
+Existing rows stay NULL until the next pipeline or ranking run; NULLs
+sort last and the API computes the score for them on the fly.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_theme_priority_score'
+down_revision: Union[str, None] = '007_kv_cache'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add priority_score to themes."""
+
+    with op.batch_alter_table('themes') as batch_op:
+        # Composite priority (0-100), see compute_priority_score
+        # Used in: /trends ordering and TrendCard "Today's Focus"
+        # Updated by: pipeline after trend stats / ranking
+        batch_op.add_column(
+            sa.Column('priority_score', sa.Float, nullable=True,
+                     comment='Composite trend priority (0-100) for /trends ordering')
+        )
+
+    # Trends page: status filter, highest priority first
+    op.create_index(
+        'idx_themes_priority',
+        'themes',
+        ['status', sa.text('priority_score DESC')],
+        sqlite_where=sa.text('urgency IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Remove priority_score from themes."""
+
+    op.drop_index('idx_themes_priority', table_name='themes')
+
+    with op.batch_alter_table('themes') as batch_op:
+        batch_op.drop_column('priority_score')
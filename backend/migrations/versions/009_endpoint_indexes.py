@@ -0,0 +1,96 @@
+"""
+009 - Endpoint Indexes: Composite indexes for list/filter endpoints
+
+Revision ID: 009_endpoint_indexes
+Revises: 008_theme_priority_score
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+Several endpoints still scan or sort without a matching index:
+- /indicators?category=, /dashboard: indicators has no index at all,
+  WHERE category = ? / IN (...) ORDER BY category, name
+- /trends: active_signals_count and the batched signal query filter
+  signals on theme_id AND status, ordered by expires_at
+- /events/today: WHERE run_date = ? ORDER BY current_score DESC
+- /events?display_section=: ORDER BY current_score DESC, published_at DESC
+
+## WHAT THIS MIGRATION DOES:
+- indicators(category, name): new
+- signals(theme_id, status, expires_at): new
+- events(run_date, current_score): replaces idx_events_run_date
+- events(display_section, current_score, published_at): replaces
+  idx_events_display (same prefix, so existing lookups still use it)
+
+Already covered (left as is):
+- causal_analyses(event_id): idx_causal_event
+- indicator_history(indicator_id, date): idx_indicator_history_lookup
+- themes(urgency, earliest_signal_expires): idx_themes_urgency_expires
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_endpoint_indexes'
+down_revision: Union[str, None] = '008_theme_priority_score'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes for endpoint filters and sorts."""
+
+    # ==================================================
+    # INDICATORS
+    # ==================================================
+    with op.batch_alter_table('indicators') as batch_op:
+        # Category filter ordered by name
+        batch_op.create_index('idx_indicators_category', ['category', 'name'])
+
+    # ==================================================
+    # SIGNALS
+    # ==================================================
+    with op.batch_alter_table('signals') as batch_op:
+        # Active signals per trend, soonest expiry first
+        batch_op.create_index(
+            'idx_signals_theme_status',
+            ['theme_id', 'status', 'expires_at']
+        )
+
+    # ==================================================
+    # EVENTS
+    # ==================================================
+    with op.batch_alter_table('events') as batch_op:
+        # Today's events by score
+        batch_op.drop_index('idx_events_run_date')
+        batch_op.create_index(
+            'idx_events_run_date_score',
+            ['run_date', 'current_score']
+        )
+        # Section lists by score, newest first on ties
+        batch_op.drop_index('idx_events_display')
+        batch_op.create_index(
+            'idx_events_display_score',
+            ['display_section', 'current_score', 'published_at']
+        )
+
+    # Refresh planner statistics so the new indexes are picked up
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    """Remove endpoint indexes."""
+
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_index('idx_events_display_score')
+        batch_op.create_index('idx_events_display', ['display_section', 'current_score'])
+        batch_op.drop_index('idx_events_run_date_score')
+        batch_op.create_index('idx_events_run_date', ['run_date'])
+
+    with op.batch_alter_table('signals') as batch_op:
+        batch_op.drop_index('idx_signals_theme_status')
+
+    with op.batch_alter_table('indicators') as batch_op:
+        batch_op.drop_index('idx_indicators_category')
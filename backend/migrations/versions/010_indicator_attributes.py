@@ -0,0 +1,55 @@
+"""
+010 - Indicator Attributes: Add the missing indicators.attributes column
+
+Revision ID: 010_indicator_attributes
+Revises: 009_endpoint_indexes
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+The Indicator model has an `attributes` column (JSON text with extra
+metric data, e.g. gold buy/sell prices for GoldPriceTable), but no
+migration ever created it. Databases built with create_tables() have it,
+databases built from migrations don't, and the API's indicator list
+queries now select it by name.
+
+## WHAT THIS MIGRATION DOES:
+Adds indicators.attributes if it isn't there yet.
+
+The downgrade keeps the column: it can't tell whether this revision
+added it or create_tables() did, and dropping a model-owned column
+would delete its data (e.g. gold buy/sell prices). A leftover nullable
+column is harmless to 009, and re-upgrading is a no-op.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_indicator_attributes'
+down_revision: Union[str, None] = '009_endpoint_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_attributes_column() -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns('indicators')
+    return any(col['name'] == 'attributes' for col in columns)
+
+
+def upgrade() -> None:
+    """Add attributes to indicators."""
+    if _has_attributes_column():
+        return
+
+    with op.batch_alter_table('indicators') as batch_op:
+        # Extra metric data as JSON text (parsed by the API)
+        batch_op.add_column(
+            sa.Column('attributes', sa.Text, nullable=True,
+                     comment='Extra metric attributes (JSON)')
+        )
+
+
+def downgrade() -> None:
+    """Keep indicators.attributes (see module docstring)."""
@@ -0,0 +1,47 @@
+"""
+011 - Theme Category: Persist the keyword category shown on trends
+
+Revision ID: 011_theme_category
+Revises: 010_indicator_attributes
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+/trends classified every theme by scanning its name against the category
+keyword lists on each request, although the result only changes when the
+theme is renamed.
+
+## WHAT THIS MIGRATION DOES:
+Adds themes.category, written by the pipeline together with
+priority_score (ThemeRepository.refresh_priority_scores). The API reads
+it as-is and only classifies rows the pipeline hasn't reached yet.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_theme_category'
+down_revision: Union[str, None] = '010_indicator_attributes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add category to themes."""
+
+    with op.batch_alter_table('themes') as batch_op:
+        # Keyword category from name_vi/name, see classify_category
+        # Used in: TrendsPanel category badges and grouping
+        batch_op.add_column(
+            sa.Column('category', sa.String(30), nullable=True,
+                     comment='Keyword category derived from theme name')
+        )
+
+
+def downgrade() -> None:
+    """Remove category from themes."""
+
+    with op.batch_alter_table('themes') as batch_op:
+        batch_op.drop_column('category')
@@ -0,0 +1,60 @@
+"""
+012 - Indicator Region: Generated region column for /indicators/region
+
+Revision ID: 012_indicator_region
+Revises: 011_theme_category
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+/indicators/region/{region} filtered with category LIKE 'vietnam%' and
+sorted by updated_at. The LIKE prefix can't be combined with an index
+on updated_at, so every request sorted the matching rows.
+
+## WHAT THIS MIGRATION DOES:
+Adds indicators.region, a VIRTUAL generated column derived from the
+category prefix ('vietnam', 'global' or 'other'), and an index on
+(region, updated_at) so the endpoint is an index range walk that stops
+after LIMIT rows. Nothing writes the column; SQLite keeps it in sync.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_indicator_region'
+down_revision: Union[str, None] = '011_theme_category'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated region column and its index."""
+
+    # Raw ALTER TABLE: generated columns can be added in place but
+    # batch mode would rebuild the table
+    op.execute(
+        """ALTER TABLE indicators ADD COLUMN region VARCHAR(20)
+           GENERATED ALWAYS AS (
+               CASE
+                   WHEN category LIKE 'vietnam%' THEN 'vietnam'
+                   WHEN category LIKE 'global%' THEN 'global'
+                   ELSE 'other'
+               END
+           ) VIRTUAL"""
+    )
+
+    # Region listing ordered by most recently updated
+    op.create_index(
+        'idx_indicators_region_updated',
+        'indicators',
+        ['region', sa.text('updated_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove region column."""
+
+    op.drop_index('idx_indicators_region_updated', table_name='indicators')
+    op.execute("ALTER TABLE indicators DROP COLUMN region")
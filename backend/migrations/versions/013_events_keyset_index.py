@@ -0,0 +1,57 @@
+"""
+013 - Events Keyset Index: Index matching /events/other cursor pagination
+
+Revision ID: 013_events_keyset_index
+Revises: 012_indicator_region
+Create Date: 2026-10-17
+
+## WHY THIS MIGRATION?
+/events/other now pages with a cursor on (published_at, id) instead of
+OFFSET, which made SQLite read and discard every skipped row. events.id
+is a TEXT primary key (not the rowid), so idx_events_section_published
+can't order ties on published_at by id without a temp B-tree.
+
+The feed sorts and seeks on COALESCE(published_at, ''): a row-value
+comparison with a NULL published_at is NULL, so undated events (which
+sort last) could never be reached through the cursor.
+
+## WHAT THIS MIGRATION DOES:
+Replaces idx_events_section_published (display_section, published_at)
+with (display_section, COALESCE(published_at, ''), id), which serves
+both the ORDER BY and the (COALESCE(published_at, ''), id) < (?, ?)
+seek.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_events_keyset_index'
+down_revision: Union[str, None] = '012_indicator_region'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Extend the section/published index with id."""
+
+    op.drop_index('idx_events_section_published', table_name='events')
+    # Other news feed: newest first (undated last), id breaks ties (cursor key)
+    op.create_index(
+        'idx_events_section_published',
+        'events',
+        ['display_section', sa.text("COALESCE(published_at, '')"), 'id']
+    )
+
+
+def downgrade() -> None:
+    """Restore the two-column index."""
+
+    op.drop_index('idx_events_section_published', table_name='events')
+    op.create_index(
+        'idx_events_section_published',
+        'events',
+        ['display_section', 'published_at']
+    )
@@ -32,7 +32,9 @@ from repositories import (
     ThemeRepository,
     WatchlistRepository,
     RunHistoryRepository,
+    KVCacheRepository,
 )
+from repositories.kv_cache import INDICATORS_GROUPED_KEY, OTHER_NEWS_COUNT_KEY
 from data_transformers import CrawlerOutput
 from data_transformers.models import MetricRecord, EventRecord, CalendarRecord
 
@@ -100,6 +102,7 @@ class Pipeline:
             logger.info("Step 0: Fetching existing titles for deduplication...")
             
             existing_titles_by_source = {}
+            existing_urls_by_source = {}
             async with get_session() as session:
                 events_repo = EventRepository(session)
                 # Get titles for each source we'll crawl
@@ -107,6 +110,10 @@ class Pipeline:
                     titles = await events_repo.get_recent_titles(source=source, days=self.lookback_days)
                     existing_titles_by_source[source] = titles
                     logger.debug(f"Found {len(titles)} existing titles for {source}")
+                # URLs for crawlers that can skip articles before fetching them
+                existing_urls_by_source["cafef"] = await events_repo.get_recent_urls(
+                    source="cafef", days=self.lookback_days
+                )
             
             total_existing = sum(len(t) for t in existing_titles_by_source.values())
             logger.info(f"Found {total_existing} existing titles across all sources")
@@ -116,7 +123,9 @@ class Pipeline:
             # ============================================
             logger.info("Step 1: Crawling data from sources...")
             
-            crawler_outputs = await self._crawl_all_sources(existing_titles_by_source)
+            crawler_outputs = await self._crawl_all_sources(
+                existing_titles_by_source, existing_urls_by_source
+            )
             
             results["steps"]["crawl"] = {
                 "sources": [o.source for o in crawler_outputs],
@@ -173,6 +182,13 @@ class Pipeline:
                 }
                 logger.info(f"Saved {metrics_saved} indicators, {history_saved} history records")
                 
+                # Materialize the grouped /indicators payload for the API
+                grouped_payload = await indicators_repo.get_grouped_payload()
+                await KVCacheRepository(session).set_value(
+                    INDICATORS_GROUPED_KEY,
+                    json.dumps(grouped_payload, ensure_ascii=False, default=str),
+                )
+                
                 # ============================================
                 # Step 3: Save calendar events
                 # ============================================
@@ -574,6 +590,9 @@ class Pipeline:
                 }
                 logger.info(f"Updated {narratives_updated} trend narratives ({len(affected_theme_ids)} affected)")
                 
+                # Re-score all trends for /trends ordering
+                await themes_repo.refresh_priority_scores()
+                
                 # ============================================
                 # Step 9: Layer 3 - Rank all active events
                 # ============================================
@@ -629,6 +648,9 @@ class Pipeline:
                 }
                 logger.info(f"Ranked {len(ranking_result.get('rankings', []))} events: {key_events_count} key, {other_news_count} other")
                 
+                # Store the section count for the dashboard
+                await self._save_other_news_count(events_repo, KVCacheRepository(session))
+                
                 # ============================================
                 # Step 10: Check watchlist triggers
                 # ============================================
@@ -741,7 +763,8 @@ class Pipeline:
     
     async def _crawl_all_sources(
         self, 
-        existing_titles_by_source: dict[str, set] = None
+        existing_titles_by_source: dict[str, set] = None,
+        existing_urls_by_source: dict[str, set] = None,
     ) -> List[CrawlerOutput]:
         """
         Crawl all configured sources and return transformed outputs.
@@ -749,10 +772,13 @@ class Pipeline:
         Args:
             existing_titles_by_source: Dict mapping source name to set of existing titles
                                        for deduplication at crawler level.
+            existing_urls_by_source: Dict mapping source name to set of existing source
+                                     URLs (same purpose, for crawlers that accept it).
         """
         from crawlers import SBVCrawler
         
         existing_titles_by_source = existing_titles_by_source or {}
+        existing_urls_by_source = existing_urls_by_source or {}
         outputs = []
         
         # SBV Crawler
@@ -818,6 +844,7 @@ class Pipeline:
                 max_articles=20,  # Limit for faster runs
                 save_raw=False,
                 existing_titles=existing_titles_by_source.get("cafef", set()),
+                existing_urls=existing_urls_by_source.get("cafef", set()),
             )
             
             if raw_result.success:
@@ -1085,8 +1112,22 @@ class Pipeline:
                     boost_factor=r["boost_factor"],
                     display_section=r["display_section"],
                 )
+            
+            await self._save_other_news_count(events_repo, KVCacheRepository(session))
+            
+            # Trend priority decays with time like event scores
+            await themes_repo.refresh_priority_scores()
         
         return ranking_result
+    
+    async def _save_other_news_count(
+        self,
+        events_repo: EventRepository,
+        kv_repo: KVCacheRepository
+    ) -> None:
+        """Store the other_news section size so /dashboard needn't COUNT(*)."""
+        count = await events_repo.count_by_section("other_news")
+        await kv_repo.set_value(OTHER_NEWS_COUNT_KEY, str(count))
 
 
 # ============================================
@@ -19,6 +19,7 @@ from .events import EventRepository
 from .insights import SignalRepository, ThemeRepository, WatchlistRepository, SignalAccuracyStatsRepository
 from .run_history import RunHistoryRepository
 from .llm_history import LLMHistoryRepository
+from .kv_cache import KVCacheRepository
 
 __all__ = [
     "BaseRepository",
@@ -32,4 +33,5 @@ __all__ = [
     # System
     "RunHistoryRepository",
     "LLMHistoryRepository",
+    "KVCacheRepository",
 ]
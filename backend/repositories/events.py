@@ -61,6 +61,12 @@ class EventRepository(BaseRepository[Event]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
+    async def count_by_section(self, section: str) -> int:
+        """Count events in a display section."""
+        stmt = select(func.count()).select_from(Event).where(Event.display_section == section)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+    
     async def get_key_events(self, limit: int = 15) -> Sequence[Event]:
         """Get key events sorted by score."""
         return await self.get_by_section("key_events", limit=limit)
@@ -185,6 +191,37 @@ class EventRepository(BaseRepository[Event]):
         
         return {t.strip() for t in titles if t}
     
+    async def get_recent_urls(
+        self,
+        source: Optional[str] = None,
+        days: int = 7
+    ) -> set[str]:
+        """
+        Get set of recent event source URLs for deduplication at crawler level.
+        
+        Lets crawlers skip an article by URL before fetching its content;
+        titles can change after publishing, the URL doesn't.
+        
+        Args:
+            source: Filter by source (e.g., 'sbv', 'cafef'). None = all sources.
+            days: How many days back to look (default: 7)
+            
+        Returns:
+            Set of source URLs
+        """
+        cutoff_date = date.today() - timedelta(days=days)
+        
+        stmt = select(Event.source_url).where(
+            Event.run_date >= cutoff_date,
+            Event.source_url.isnot(None),
+        )
+        
+        if source:
+            stmt = stmt.where(Event.source == source)
+        
+        result = await self.session.execute(stmt)
+        return {url for url in result.scalars().all() if url}
+    
     # ============================================
     # EVENT CREATION
     # ============================================
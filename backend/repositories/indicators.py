@@ -3,16 +3,66 @@ Indicator Repository
 
 Handles all database operations for indicators and indicator history.
 """
+import json
+from collections import defaultdict
 from datetime import date, datetime
 from typing import Optional, List, Sequence
 
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from data_transformers.sbv import INDICATOR_GROUPS
 from database.models import Indicator, IndicatorHistory
 from .base import BaseRepository
 
 
+# Columns returned by indicator list views (IndicatorCard, IndicatorPanel).
+# source_url and created_at are only needed by /indicators/{id}.
+INDICATOR_LIST_COLUMNS = """id, name, name_vi, category, subcategory, value, unit,
+    change, change_pct, trend, source, attributes, updated_at"""
+
+
+def group_indicators(indicators: list[dict]) -> dict:
+    """
+    Build the /indicators?grouped=true response from indicator rows.
+    
+    An indicator belongs to a group if its category matches the group id
+    or its id is listed in the group's indicators. Rows keep their input
+    order within each group.
+    
+    Args:
+        indicators: Indicator rows as dicts, attributes already parsed
+        
+    Returns:
+        {"groups": {group_id: {...}}, "total": N}
+    """
+    # Index positions by category and id once, so each group is a
+    # lookup instead of a scan over every indicator
+    positions_by_category = defaultdict(list)
+    position_by_id = {}
+    for pos, ind in enumerate(indicators):
+        positions_by_category[ind.get('category')].append(pos)
+        position_by_id[ind.get('id')] = pos
+    
+    grouped_data = {}
+    for group_id, group_info in INDICATOR_GROUPS.items():
+        positions = set(positions_by_category.get(group_id, []))
+        positions.update(
+            position_by_id[ind_id] for ind_id in group_info.get("indicators", [])
+            if ind_id in position_by_id
+        )
+        group_result = {
+            "display_name": group_info["display_name"],
+            "indicators": [indicators[pos] for pos in sorted(positions)]
+        }
+        # Pass expandable metadata for gold group
+        if group_info.get("expandable"):
+            group_result["expandable"] = True
+            group_result["primary_indicators"] = group_info.get("primary_indicators", [])
+        grouped_data[group_id] = group_result
+    return {"groups": grouped_data, "total": len(indicators)}
+
+
 class IndicatorRepository(BaseRepository[Indicator]):
     """Repository for indicator operations."""
     
@@ -44,6 +94,25 @@ class IndicatorRepository(BaseRepository[Indicator]):
             grouped[category].append(indicator)
         return grouped
     
+    async def get_grouped_payload(self) -> dict:
+        """
+        Build the grouped indicators API payload.
+        
+        Reads raw rows (not ORM objects) so values serialize exactly as
+        the API's own queries return them.
+        """
+        result = await self.session.execute(
+            text(f"SELECT {INDICATOR_LIST_COLUMNS} FROM indicators ORDER BY category, name")
+        )
+        indicators = [dict(row) for row in result.mappings()]
+        for ind in indicators:
+            if ind.get('attributes'):
+                try:
+                    ind['attributes'] = json.loads(ind['attributes'])
+                except (ValueError, TypeError):
+                    pass
+        return group_indicators(indicators)
+    
     async def upsert(
         self,
         indicator_id: str,
@@ -9,9 +9,13 @@ This repository now includes methods for the unified "Trends" view:
 - get_trends_with_signals(): Main trends query with ordering by urgency
 - get_by_urgency(): Filter by urgency level
 - recompute_trend_stats(): Update computed fields when signals change
+- refresh_priority_scores(): Re-score/classify all listed trends (time-dependent)
 - update_narrative(): Set AI-generated narrative
 """
-from datetime import timedelta
+import functools
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Optional, List, Sequence
 
 from sqlalchemy import select, desc, Integer
@@ -21,6 +25,126 @@ from database.models import Theme
 from ..base import BaseRepository
 
 
+# Category keywords for auto-classification of themes by name.
+# Order matters: first match wins. More specific patterns first.
+CATEGORY_KEYWORDS = {
+    'gold': ['vàng', 'gold', 'kim loại quý', 'bạc tích trữ'],
+    'monetary': ['lãi suất', 'tiền tệ', 'ngân hàng trung ương', 'omo', 'thanh khoản',
+                 'tín phiếu', 'huy động', 'tiền gửi', 'fed', 'deposit rate', 'interbank',
+                 'tái cơ cấu ngân hàng', 'tăng trưởng ngân hàng'],
+    'trade': ['thương mại', 'thuế quan', 'tariff', 'trade', 'xuất khẩu', 'nhập khẩu',
+              'bảo hộ', 'trừng phạt'],
+    'forex': ['tỷ giá', 'usd/vnd', 'forex', 'ngoại hối', 'đô la', 'nhân dân tệ',
+              'yên', 'đồng', 'dxy'],
+    'equity': ['chứng khoán', 'cổ phiếu', 'vnindex', 'nâng hạng', 'ipo', 'quỹ ngoại',
+               'danh mục'],
+    'energy': ['năng lượng', 'dầu', 'oil', 'gas', 'điện', 'xăng'],
+    'geopolitics': ['địa chính trị', 'quân sự', 'trung đông', 'chiến tranh', 'leo thang',
+                    'xung đột'],
+    'realestate': ['bất động sản', 'nhà ở', 'metro', 'hạ tầng', 'đô thị'],
+    'tech': ['ai ', 'công nghệ', 'chuyển đổi số', 'bán dẫn', 'fdi công nghệ'],
+    'agriculture': ['nông sản', 'nông nghiệp', 'thực phẩm', 'gạo', 'cà phê'],
+    'macro': ['gdp', 'cpi', 'lạm phát', 'tăng trưởng', 'kinh tế vĩ mô', 'tài khóa',
+              'đầu tư công', 'phục hồi kinh tế', 'du lịch'],
+    'fiscal': ['thuế', 'ngân sách', 'thuế suất', 'tuân thủ thuế'],
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def classify_category(name: str) -> str:
+    """
+    Classify a theme into a category based on name keywords.
+    
+    Memoized: the same trend names are classified on every /trends load.
+    """
+    name_lower = (name or '').lower()
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for kw in keywords:
+            if kw in name_lower:
+                return category
+    return 'other'
+
+
+# Priority score constants, computed once instead of per trend
+_CONFIDENCE_WEIGHTS = {'high': 3, 'medium': 2, 'low': 1}
+_LOG2_50 = math.log2(50)
+_LOG2_20 = math.log2(20)
+
+
+def compute_priority_score(trend: dict, now: Optional[datetime] = None) -> float:
+    """
+    Compute composite priority score (0-100) for a trend.
+    
+    Components:
+    - Signal density (30%): More active signals = more important
+    - Average confidence (25%): high > medium > low
+    - Strength (15%): Theme strength from LLM
+    - Time urgency (15%): Days until earliest signal expires
+    - Evidence breadth (15%): More events = more evidence
+    
+    This score determines which trends appear in "Today's Focus".
+    
+    Pass `now` when scoring a batch so the clock is read once.
+    """
+    signals = trend.get('signals', [])
+    active_signals = [s for s in signals if s.get('status') == 'active']
+    sig_count = len(active_signals)
+    
+    # 1. Signal density (0-30): logarithmic scale, diminishing returns after ~10
+    # 1 signal → ~9, 5 signals → ~21, 10 → ~27, 43 → ~30
+    sig_score = min(30, math.log2(sig_count + 1) / _LOG2_50 * 30) if sig_count > 0 else 0
+    
+    # 2. Average confidence (0-25)
+    if active_signals:
+        avg_conf = sum(_CONFIDENCE_WEIGHTS.get(s.get('confidence', 'low'), 1) for s in active_signals) / len(active_signals)
+    else:
+        avg_conf = 1
+    conf_score = (avg_conf / 3.0) * 25
+    
+    # 3. Strength (0-15)
+    strength = trend.get('strength', 0) or 0
+    strength_score = min(strength, 1.0) * 15
+    
+    # 4. Time urgency (0-15): inverted — sooner expiry = higher score
+    expires = trend.get('earliest_signal_expires')
+    if expires:
+        try:
+            # Pipeline passes datetimes; API rows carry ISO text (3.11+ parses 'Z')
+            exp_dt = expires if isinstance(expires, datetime) else datetime.fromisoformat(expires)
+            now = now or datetime.now()
+            days_left = max(0, (exp_dt.replace(tzinfo=None) - now).total_seconds() / 86400)
+        except:
+            days_left = 14
+    else:
+        days_left = 14
+    
+    if days_left < 1:
+        time_score = 15
+    elif days_left < 3:
+        time_score = 12
+    elif days_left < 7:
+        time_score = 8
+    else:
+        time_score = 4
+    
+    # 5. Evidence breadth (0-15): logarithmic
+    event_count = trend.get('event_count', 0) or 0
+    evidence_score = min(15, math.log2(event_count + 1) / _LOG2_20 * 15) if event_count > 0 else 0
+    
+    total = sig_score + conf_score + strength_score + time_score + evidence_score
+    return round(total, 1)
+
+
+def _priority_input(theme: Theme, active_confidences: list[str]) -> dict:
+    """Shape a Theme into the dict compute_priority_score expects."""
+    return {
+        'signals': [{'status': 'active', 'confidence': c} for c in active_confidences],
+        'strength': theme.strength,
+        'earliest_signal_expires': theme.earliest_signal_expires,
+        'event_count': theme.event_count,
+    }
+
+
 class ThemeRepository(BaseRepository[Theme]):
     """Repository for theme operations."""
     
@@ -385,14 +509,16 @@ class ThemeRepository(BaseRepository[Theme]):
         await self.session.execute(expire_stmt)
         
         # Step 2: Count truly active signals (not expired)
-        stmt_count = select(func.count(Signal.id)).where(
+        # Confidences are kept for the priority score
+        stmt_active = select(Signal.confidence).where(
             and_(
                 Signal.theme_id == theme_id,
                 Signal.status == 'active'
             )
         )
-        result = await self.session.execute(stmt_count)
-        signals_count = result.scalar() or 0
+        result = await self.session.execute(stmt_active)
+        active_confidences = list(result.scalars().all())
+        signals_count = len(active_confidences)
         
         # Step 3: Get earliest expiry of ACTIVE signals only
         stmt_expiry = select(func.min(Signal.expires_at)).where(
@@ -442,10 +568,54 @@ class ThemeRepository(BaseRepository[Theme]):
         theme.signals_verified_count = verified_count
         theme.signals_correct_count = correct_count
         theme.signals_accuracy = accuracy
+        theme.priority_score = compute_priority_score(
+            _priority_input(theme, active_confidences), now
+        )
+        theme.category = classify_category(theme.name_vi or theme.name)
         theme.updated_at = now
         
         return await self.update(theme)
     
+    async def refresh_priority_scores(self) -> int:
+        """
+        Recompute priority_score and category for every theme listed by /trends.
+        
+        The score's time-urgency component changes as signal expiries
+        approach, so this runs on every pipeline/ranking run rather than
+        only when a theme's signals change. Category is refreshed alongside
+        so themes created or renamed since the last run are classified.
+        
+        Returns: Number of themes scored
+        """
+        from database.models import Signal
+        
+        statuses = ['active', 'emerging', 'fading']
+        result = await self.session.execute(
+            select(Theme).where(Theme.status.in_(statuses))
+        )
+        themes = result.scalars().all()
+        if not themes:
+            return 0
+        
+        # Active signal confidences for all those themes in one query
+        stmt = (
+            select(Signal.theme_id, Signal.confidence)
+            .join(Theme, Theme.id == Signal.theme_id)
+            .where(Theme.status.in_(statuses), Signal.status == 'active')
+        )
+        confidences = defaultdict(list)
+        for theme_id, confidence in (await self.session.execute(stmt)).all():
+            confidences[theme_id].append(confidence)
+        
+        now = self.now()
+        for theme in themes:
+            theme.priority_score = compute_priority_score(
+                _priority_input(theme, confidences[theme.id]), now
+            )
+            theme.category = classify_category(theme.name_vi or theme.name)
+        await self.session.flush()
+        return len(themes)
+    
     async def update_narrative(
         self,
         theme_id: str,
@@ -0,0 +1,33 @@
+"""
+KV Cache Repository
+
+Handles reads and writes of precomputed API payloads (kv_cache table).
+"""
+from typing import Optional
+
+from database.models import KVCache
+from .base import BaseRepository
+
+
+# Keys written by the pipeline
+INDICATORS_GROUPED_KEY = "indicators_grouped"    # /indicators?grouped=true body
+OTHER_NEWS_COUNT_KEY = "other_news_count"        # /dashboard other_news_count
+
+
+class KVCacheRepository(BaseRepository[KVCache]):
+    """Repository for precomputed payloads."""
+    
+    model = KVCache
+    
+    async def get_value(self, key: str) -> Optional[str]:
+        """Get the stored JSON text for a key."""
+        entry = await self.session.get(KVCache, key)
+        return entry.value if entry else None
+    
+    async def set_value(self, key: str, value: str) -> KVCache:
+        """Insert or replace the JSON text for a key."""
+        entry = await self.session.merge(
+            KVCache(key=key, value=value, updated_at=self.now())
+        )
+        await self.session.flush()
+        return entry
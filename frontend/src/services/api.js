@@ -49,6 +49,9 @@ export const getIndicator = (id) =>
 export const getIndicatorHistory = (id, days = 30) => 
   fetchAPI(`/indicators/${id}/history?days=${days}`);
 
+export const getIndicatorsHistory = (ids, days = 30) => 
+  fetchAPI(`/indicators/history?ids=${ids.map(encodeURIComponent).join(',')}&days=${days}`);
+
 // ============================================================
 // Events
 // ============================================================
@@ -59,8 +62,8 @@ export const getEvents = (params = {}) => {
 
 export const getKeyEvents = () => fetchAPI('/events/key');
 
-export const getOtherNews = (limit = 30, offset = 0) => 
-  fetchAPI(`/events/other?limit=${limit}&offset=${offset}`);
+export const getOtherNews = (limit = 30, offset = 0, cursor = null) => 
+  fetchAPI(`/events/other?limit=${limit}&${cursor ? `cursor=${encodeURIComponent(cursor)}` : `offset=${offset}`}`);
 
 export const getTodayEvents = () => fetchAPI('/events/today');
 
@@ -138,6 +141,13 @@ export const getUrgentTrendsSidebar = () => fetchAPI('/trends/urgent/sidebar');
 export const archiveTrend = (id) => 
   fetchAPI(`/trends/${id}/archive`, { method: 'POST' });
 
+/**
+ * Archive several trends in one request
+ * Returns: { success, archived } (number of trends archived)
+ */
+export const archiveTrends = (ids) => 
+  fetchAPI('/trends/archive', { method: 'POST', body: JSON.stringify(ids) });
+
 /**
  * Dismiss a trend (moves to fading section)
  * Used by: TrendDetail "Dismiss" button  
@@ -204,6 +214,7 @@ export default {
   getIndicatorsByRegion,
   getIndicator,
   getIndicatorHistory,
+  getIndicatorsHistory,
   getEvents,
   getKeyEvents,
   getOtherNews,
@@ -220,6 +231,7 @@ export default {
   getTrend,
   getUrgentTrendsSidebar,
   archiveTrend,
+  archiveTrends,
   dismissTrend,
   // Watchlist
   getWatchlist,